@@ -0,0 +1,87 @@
+# /**
+#  * Time and quality of Wu quantization at each histogram resolution.
+#  *
+#  * For every test asset, at the default thumbnail size and at full size,
+#  * prints how long QuantizerWu and QuantizerWuNumpy take for 128 colors, and
+#  * the mean CIE Lab distance (delta E 76) from each pixel to the closest
+#  * color of the palette. Requires NumPy.
+#  *
+#  *     python benchmarks/wu_index_bits.py [image ...]
+#  */
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import PIL.Image
+
+from material_color_utilities_python.quantize.quantizer_wu import QuantizerWu
+from material_color_utilities_python.quantize.quantizer_wu_numpy import QuantizerWuNumpy
+from material_color_utilities_python.utils.color_utils_numpy import lab_from_argb
+from material_color_utilities_python.utils.image_utils import (
+    DEFAULT_MAX_PIXELS,
+    downsample_image,
+    get_argb_histogram,
+)
+
+ASSETS = Path(__file__).resolve().parent.parent / "tests" / "assets"
+MAX_COLORS = 128
+INDEX_BITS = (4, 5, 6)
+REPEATS = 3
+
+
+def best_time(function):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def mean_error(colors, counts, palette):
+    pixels = lab_from_argb(np.array(colors, dtype=np.uint32)).T
+    centers = lab_from_argb(np.array(palette, dtype=np.uint32)).T
+    weights = np.array(counts, dtype=np.float64)
+    nearest = np.full(len(pixels), np.inf)
+    for center in centers:
+        nearest = np.minimum(nearest, np.sum((pixels - center) ** 2, axis=1))
+    return float(np.sum(np.sqrt(nearest) * weights) / np.sum(weights))
+
+
+def main(paths):
+    print("image                 pixels   bits  python ms  numpy ms  colors  mean dE")
+    for path in paths:
+        image = PIL.Image.open(path)
+        image.load()
+        for max_pixels in (DEFAULT_MAX_PIXELS, None):
+            histogram = get_argb_histogram(downsample_image(image, max_pixels))
+            colors = list(histogram.keys())
+            counts = list(histogram.values())
+            for index_bits in INDEX_BITS:
+                python_time, _ = best_time(
+                    partial(
+                        QuantizerWu(index_bits=index_bits).quantize_counts,
+                        colors,
+                        counts,
+                        MAX_COLORS,
+                    )
+                )
+                numpy_time, palette = best_time(
+                    partial(
+                        QuantizerWuNumpy(index_bits=index_bits).quantize_counts,
+                        colors,
+                        counts,
+                        MAX_COLORS,
+                    )
+                )
+                print(
+                    f"{Path(path).name:20} {sum(counts):>8} {index_bits:>5} "
+                    f"{python_time * 1000:>10.1f} {numpy_time * 1000:>9.1f} "
+                    f"{len(palette):>7} {mean_error(colors, counts, palette):>8.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or sorted(ASSETS.glob("*.jpg")))
@@ -1,4 +1,15 @@
-from .utils.image_utils import QuantizerCelebi, Score, argb_from_rgb
+from .hct.max_chroma_table import max_chroma
+from .utils.async_utils import (
+    configure_executor,
+    custom_color_async,
+    shutdown_executor,
+    source_color_from_image_async,
+    theme_from_image_async,
+    theme_from_source_color_async,
+)
+from .utils.batch_utils import source_colors_from_images, themes_from_images
+from .utils.color_utils import argb_from_rgb
+from .utils.image_utils import QuantizerCelebi, Score
 from .utils.string_utils import (
     argb_from_hex,
     blue_from_argb,
@@ -36,4 +47,13 @@ __all__ = [
     Score,
     argb_from_rgb,
     QuantizerCelebi,
+    max_chroma,
+    source_colors_from_images,
+    themes_from_images,
+    source_color_from_image_async,
+    theme_from_image_async,
+    theme_from_source_color_async,
+    custom_color_async,
+    configure_executor,
+    shutdown_executor,
 ]
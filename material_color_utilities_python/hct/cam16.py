@@ -4,9 +4,16 @@ from material_color_utilities_python.hct.viewing_conditions import (
     ViewingConditions,
     default_viewing_conditions,
 )
-from material_color_utilities_python.utils.color_utils import argb_from_xyz, linearized
+from material_color_utilities_python.utils.color_utils import (
+    LINEARIZED_TABLE,
+    argb_from_xyz,
+)
 from material_color_utilities_python.utils.math_utils import signum
 
+# Set by hct_table.enable_hct_table to a function returning (hue, chroma, j) for
+# an ARGB color in default viewing conditions; None computes them instead.
+hue_chroma_j_lookup = None
+
 
 # /**
 #  * CAM16, a color appearance model. Colors are not just defined by their hex
@@ -26,6 +33,18 @@ from material_color_utilities_python.utils.math_utils import signum
 #  * hue 203, chroma 3, lightness 100)
 #  */
 class Cam16:
+    __slots__ = (
+        "chroma",
+        "hue",
+        "internal_a_star",
+        "internal_b_star",
+        "internal_j_star",
+        "j",
+        "m",
+        "q",
+        "s",
+    )
+
     # /**
     #  * All the CAM16 dimensions can be calculated from 3 of the dimensions, in
     #  * the following combinations:
@@ -45,17 +64,47 @@ class Cam16:
     #  * @param j_star CAM16-UCS J coordinate
     #  * @param a_star CAM16-UCS a coordinate
     #  * @param b_star CAM16-UCS b coordinate
+    #  *
+    #  * The CAM16-UCS coordinates may be omitted, in which case they are computed
+    #  * from j, m and hue the first time one of them is read.
     #  */
-    def __init__(self, hue, chroma, j, q, m, s, j_star, a_star, b_star):
+    def __init__(self, hue, chroma, j, q, m, s, j_star=None, a_star=None, b_star=None):
         self.hue = hue
         self.chroma = chroma
         self.j = j
         self.q = q
         self.m = m
         self.s = s
-        self.j_star = j_star
-        self.a_star = a_star
-        self.b_star = b_star
+        self.internal_j_star = j_star
+        self.internal_a_star = a_star
+        self.internal_b_star = b_star
+
+    def compute_ucs(self):
+        hue_radians = (self.hue * math.pi) / 180.0
+        j = self.j
+        self.internal_j_star = ((1.0 + 100.0 * 0.007) * j) / (1.0 + 0.007 * j)
+        mstar = (1.0 / 0.0228) * math.log(1.0 + 0.0228 * self.m)
+        self.internal_a_star = mstar * math.cos(hue_radians)
+        self.internal_b_star = mstar * math.sin(hue_radians)
+
+    def get_j_star(self):
+        if self.internal_j_star is None:
+            self.compute_ucs()
+        return self.internal_j_star
+
+    def get_a_star(self):
+        if self.internal_a_star is None:
+            self.compute_ucs()
+        return self.internal_a_star
+
+    def get_b_star(self):
+        if self.internal_b_star is None:
+            self.compute_ucs()
+        return self.internal_b_star
+
+    j_star = property(get_j_star)
+    a_star = property(get_a_star)
+    b_star = property(get_b_star)
 
     # /**
     #  * CAM16 instances also have coordinates in the CAM16-UCS space, called J*,
@@ -87,12 +136,57 @@ class Cam16:
     #  */
     @staticmethod
     def from_int_in_viewing_conditions(argb, viewing_conditions):
+        hue, c, j, alpha = Cam16.hue_chroma_j_alpha(argb, viewing_conditions)
+        q = (
+            (4.0 / viewing_conditions.c)
+            * math.sqrt(j / 100.0)
+            * (viewing_conditions.aw + 4.0)
+            * viewing_conditions.fLRoot
+        )
+        m = c * viewing_conditions.fLRoot
+        s = 50.0 * math.sqrt(
+            (alpha * viewing_conditions.c) / (viewing_conditions.aw + 4.0)
+        )
+        return Cam16(hue, c, j, q, m, s)
+
+    # /**
+    #  * Computes only the dimensions most callers need, skipping q, m, s and
+    #  * the CAM16-UCS coordinates.
+    #  *
+    #  * @param argb ARGB representation of a color.
+    #  * @return A tuple (hue, chroma, j), assuming the color was viewed in
+    #  *     default viewing conditions.
+    #  */
+    @staticmethod
+    def hue_chroma_j_from_int(argb):
+        if hue_chroma_j_lookup is not None:
+            return hue_chroma_j_lookup(argb)
+        return Cam16.hue_chroma_j_from_int_in_viewing_conditions(
+            argb, default_viewing_conditions
+        )
+
+    # /**
+    #  * @param argb ARGB representation of a color.
+    #  * @param viewing_conditions Information about the environment where the color
+    #  *     was observed.
+    #  * @return A tuple (hue, chroma, j) of the color in the given viewing
+    #  *     conditions.
+    #  */
+    @staticmethod
+    def hue_chroma_j_from_int_in_viewing_conditions(argb, viewing_conditions):
+        hue, c, j, _ = Cam16.hue_chroma_j_alpha(argb, viewing_conditions)
+        return hue, c, j
+
+    # Shared by the conversions from ARGB; alpha is the intermediate that s is
+    # computed from.
+    @staticmethod
+    def hue_chroma_j_alpha(argb, viewing_conditions):
         red = (argb & 0x00FF0000) >> 16
         green = (argb & 0x0000FF00) >> 8
         blue = argb & 0x000000FF
-        red_l = linearized(red)
-        green_l = linearized(green)
-        blue_l = linearized(blue)
+        red_l = LINEARIZED_TABLE[red]
+        green_l = LINEARIZED_TABLE[green]
+        blue_l = LINEARIZED_TABLE[blue]
         x = 0.41233895 * red_l + 0.35762064 * green_l + 0.18051042 * blue_l
         y = 0.2126 * red_l + 0.7152 * green_l + 0.0722 * blue_l
         z = 0.01932141 * red_l + 0.11916382 * green_l + 0.95034478 * blue_l
@@ -121,32 +215,17 @@ class Cam16:
             if atan_degrees >= 360
             else atan_degrees
         )
-        hue_radians = (hue * math.pi) / 180.0
         ac = p2 * viewing_conditions.nbb
         j = 100.0 * pow(
             ac / viewing_conditions.aw, viewing_conditions.c * viewing_conditions.z
         )
-        q = (
-            (4.0 / viewing_conditions.c)
-            * math.sqrt(j / 100.0)
-            * (viewing_conditions.aw + 4.0)
-            * viewing_conditions.fLRoot
-        )
         hue_prime = hue + 360 if hue < 20.14 else hue
         e_hue = 0.25 * (math.cos((hue_prime * math.pi) / 180.0 + 2.0) + 3.8)
         p1 = (50000.0 / 13.0) * e_hue * viewing_conditions.nc * viewing_conditions.ncb
         t = (p1 * math.sqrt(a * a + b * b)) / (u + 0.305)
         alpha = pow(t, 0.9) * pow(1.64 - pow(0.29, viewing_conditions.n), 0.73)
         c = alpha * math.sqrt(j / 100.0)
-        m = c * viewing_conditions.fLRoot
-        s = 50.0 * math.sqrt(
-            (alpha * viewing_conditions.c) / (viewing_conditions.aw + 4.0)
-        )
-        j_star = ((1.0 + 100.0 * 0.007) * j) / (1.0 + 0.007 * j)
-        mstar = (1.0 / 0.0228) * math.log(1.0 + 0.0228 * m)
-        a_star = mstar * math.cos(hue_radians)
-        b_star = mstar * math.sin(hue_radians)
-        return Cam16(hue, c, j, q, m, s, j_star, a_star, b_star)
+        return hue, c, j, alpha
 
     # /**
     #  * @param j CAM16 lightness
@@ -177,12 +256,7 @@ class Cam16:
         s = 50.0 * math.sqrt(
             (alpha * viewing_conditions.c) / (viewing_conditions.aw + 4.0)
         )
-        hue_radians = (h * math.pi) / 180.0
-        j_star = ((1.0 + 100.0 * 0.007) * j) / (1.0 + 0.007 * j)
-        mstar = (1.0 / 0.0228) * math.log(1.0 + 0.0228 * m)
-        a_star = mstar * math.cos(hue_radians)
-        b_star = mstar * math.sin(hue_radians)
-        return Cam16(h, c, j, q, m, s, j_star, a_star, b_star)
+        return Cam16(h, c, j, q, m, s)
 
     # /**
     #  * @param j_star CAM16-UCS lightness.
@@ -14,6 +14,9 @@
 #  * and a difference of 50 guarantees a contrast ratio >= 4.5.
 #  */
 from material_color_utilities_python.hct.cam16 import Cam16
+from material_color_utilities_python.hct.hct_cache import HctCache
+from material_color_utilities_python.hct.hct_solver import HctSolver
+from material_color_utilities_python.hct.max_chroma_table import max_chroma_bound
 from material_color_utilities_python.hct.viewing_conditions import (
     default_viewing_conditions,
 )
@@ -47,6 +50,69 @@ DL_MAX = 0.2
 #  */
 LIGHTNESS_SEARCH_ENDPOINT = 0.01
 
+# /**
+#  * Algorithms available for mapping hue, chroma and tone to an sRGB color.
+#  *
+#  * SOLVER_ANALYTIC inverts CAM16 directly with HctSolver and finishes in a
+#  * bounded number of steps. SOLVER_SEARCH is the original nested binary search
+#  * over chroma and J, kept so the two can be checked against each other.
+#  */
+SOLVER_ANALYTIC = "analytic"
+SOLVER_SEARCH = "search"
+SOLVERS = (SOLVER_ANALYTIC, SOLVER_SEARCH)
+
+# The solver get_int uses when none is passed explicitly.
+default_solver = SOLVER_ANALYTIC
+
+
+# /**
+#  * Selects the solver get_int and get_int_in_viewing_conditions use when no
+#  * solver is passed explicitly.
+#  *
+#  * @param solver SOLVER_ANALYTIC or SOLVER_SEARCH.
+#  */
+def set_default_solver(solver):
+    global default_solver
+    if solver not in SOLVERS:
+        raise ValueError("unexpected solver " + str(solver))
+    default_solver = solver
+
+
+# The HctCache get_int consults, or None when caching is disabled.
+cache = None
+
+
+# /**
+#  * Memoizes get_int and get_int_in_viewing_conditions in a bounded LRU cache.
+#  * Replaces any cache that was enabled before.
+#  *
+#  * @param max_entries The number of colors kept before the least recently used
+#  *     one is evicted.
+#  * @param quantization Step hue, chroma and tone are rounded to before lookup
+#  *     and solving; None keys on the exact values.
+#  * @return The new HctCache.
+#  */
+def enable_cache(max_entries=4096, quantization=None):
+    global cache
+    cache = HctCache(max_entries, quantization)
+    return cache
+
+
+# /**
+#  * Stops memoizing get_int and drops the cached colors.
+#  */
+def disable_cache():
+    global cache
+    cache = None
+
+
+# /**
+#  * @return HctCacheStats for the enabled cache, or None when caching is
+#  *     disabled.
+#  */
+def cache_stats():
+    return cache.stats() if cache is not None else None
+
 
 # /**
 #  * @param hue CAM16 hue
@@ -86,13 +152,16 @@ def find_cam_by_j(hue, chroma, tone):
 
 
 # /**
+#  * Finds the color with the given hue, chroma and tone by binary searching
+#  * over chroma, and over J for each chroma tried.
+#  *
 #  * @param hue CAM16 hue.
 #  * @param chroma CAM16 chroma.
 #  * @param tone L*a*b* lightness.
 #  * @param viewing_conditions Information about the environment where the color
 #  *     was observed.
 #  */
-def get_int_in_viewing_conditions(hue, chroma, tone, viewing_conditions):
+def search_int_in_viewing_conditions(hue, chroma, tone, viewing_conditions):
     if chroma < 1.0 or round(tone) <= 0.0 or round(tone) >= 100.0:
         return argb_from_lstar(tone)
 
@@ -122,6 +191,52 @@ def get_int_in_viewing_conditions(hue, chroma, tone, viewing_conditions):
     return answer.viewed(viewing_conditions)
 
 
+# /**
+#  * Finds the color with the given hue, chroma and tone with HctSolver.
+#  *
+#  * @param hue CAM16 hue.
+#  * @param chroma CAM16 chroma.
+#  * @param tone L*a*b* lightness.
+#  * @param viewing_conditions Information about the environment where the color
+#  *     was observed.
+#  */
+def solve_int_in_viewing_conditions(hue, chroma, tone, viewing_conditions):
+    bound = max_chroma_bound(hue, tone)
+    if bound is not None and chroma > bound:
+        argb = HctSolver.solve_max_chroma_to_int(hue, tone)
+    else:
+        argb = HctSolver.solve_to_int(hue, chroma, tone)
+    if viewing_conditions is default_viewing_conditions:
+        return argb
+    return Cam16.from_int(argb).viewed(viewing_conditions)
+
+
+# /**
+#  * @param hue CAM16 hue.
+#  * @param chroma CAM16 chroma.
+#  * @param tone L*a*b* lightness.
+#  * @param viewing_conditions Information about the environment where the color
+#  *     was observed.
+#  * @param solver SOLVER_ANALYTIC or SOLVER_SEARCH; defaults to default_solver.
+#  */
+def get_int_in_viewing_conditions(hue, chroma, tone, viewing_conditions, solver=None):
+    if solver is None:
+        solver = default_solver
+    if cache is not None:
+        return cache.get_int(
+            hue, chroma, tone, viewing_conditions, solver, solve_with_solver
+        )
+    return solve_with_solver(hue, chroma, tone, viewing_conditions, solver)
+
+
+def solve_with_solver(hue, chroma, tone, viewing_conditions, solver):
+    if solver == SOLVER_ANALYTIC:
+        return solve_int_in_viewing_conditions(hue, chroma, tone, viewing_conditions)
+    elif solver == SOLVER_SEARCH:
+        return search_int_in_viewing_conditions(hue, chroma, tone, viewing_conditions)
+    raise ValueError("unexpected solver " + str(solver))
+
+
 # /**
 #  * @param hue a number, in degrees, representing ex. red, orange, yellow, etc.
 #  *     Ranges from 0 <= hue < 360.
@@ -130,14 +245,16 @@ def get_int_in_viewing_conditions(hue, chroma, tone, viewing_conditions):
 #  *    maximum for any given hue and tone, so the color returned may be lower
 #  *    than the requested chroma.
 #  * @param tone Lightness. Ranges from 0 to 100.
+#  * @param solver SOLVER_ANALYTIC or SOLVER_SEARCH; defaults to default_solver.
 #  * @return ARGB representation of a color in default viewing conditions
 #  */
-def get_int(hue, chroma, tone):
+def get_int(hue, chroma, tone, solver=None):
     return get_int_in_viewing_conditions(
         sanitize_degrees_double(hue),
         chroma,
         clamp_double(0.0, 100.0, tone),
         default_viewing_conditions,
+        solver,
     )
 
 
@@ -145,13 +262,40 @@ def get_int(hue, chroma, tone):
 #  * HCT, hue, chroma, and tone. A color system that provides a perceptually
 #  * accurate color measurement system that can also accurately render what colors
 #  * will appear as in different lighting environments.
+#  *
+#  * An Hct is solved lazily: constructing one, or setting its hue, chroma or
+#  * tone, only records the request. The gamut solve runs the first time the
+#  * ARGB value or one of the components is read, and its result is kept until
+#  * the next set. Setting a component of an unsolved Hct replaces that part of
+#  * the pending request, so chroma is clipped to the gamut once, at the end.
+#  *
+#  * This changes chained sets. Setting hue, chroma and tone in a row without
+#  * reading gives the color of the final request. Previously each set solved
+#  * at once, so a chroma clipped by one set carried into the next. Reading a
+#  * component after construction and after each set still gives the previous
+#  * results.
 #  */
 class Hct:
-    def __init__(self, internal_hue, internal_chroma, internal_tone):
+    __slots__ = (
+        "argb",
+        "internal_chroma",
+        "internal_hue",
+        "internal_tone",
+        "measured",
+    )
+
+    # /**
+    #  * @param argb The ARGB value the hue, chroma and tone were measured from,
+    #  *     or None if they are a request that still has to be solved.
+    #  */
+    def __init__(self, internal_hue, internal_chroma, internal_tone, argb=None):
         self.internal_hue = internal_hue
         self.internal_chroma = internal_chroma
         self.internal_tone = internal_tone
-        self.set_internal_state(self.to_int())
+        self.argb = argb
+        # Whether the internal hue, chroma and tone were measured from argb,
+        # rather than being the request argb is solved from.
+        self.measured = argb is not None
 
     # /**
     #  * @param hue 0 <= hue < 360; invalid values are corrected.
@@ -172,18 +316,31 @@ class Hct:
     #  */
     @staticmethod
     def from_int(argb):
-        cam = Cam16.from_int(argb)
+        hue, chroma, _ = Cam16.hue_chroma_j_from_int(argb)
         tone = lstar_from_argb(argb)
-        return Hct(cam.hue, cam.chroma, tone)
+        return Hct(hue, chroma, tone, argb)
 
     def to_int(self):
-        return get_int(self.internal_hue, self.internal_chroma, self.internal_tone)
+        if self.argb is None:
+            self.argb = get_int(
+                self.internal_hue, self.internal_chroma, self.internal_tone
+            )
+        return self.argb
+
+    # /**
+    #  * Solves a pending request, replacing the requested hue, chroma and tone
+    #  * with those of the color that was found.
+    #  */
+    def resolve(self):
+        if not self.measured:
+            self.set_internal_state(self.to_int())
 
     # /**
     #  * A number, in degrees, representing ex. red, orange, yellow, etc.
     #  * Ranges from 0 <= hue < 360.
     #  */
     def get_hue(self):
+        self.resolve()
         return self.internal_hue
 
     # /**
@@ -192,15 +349,12 @@ class Hct:
     #  * hue and tone.
     #  */
     def set_hue(self, new_hue):
-        self.set_internal_state(
-            get_int(
-                sanitize_degrees_double(new_hue),
-                self.internal_chroma,
-                self.internal_tone,
-            )
-        )
+        self.internal_hue = sanitize_degrees_double(new_hue)
+        self.argb = None
+        self.measured = False
 
     def get_chroma(self):
+        self.resolve()
         return self.internal_chroma
 
     # /**
@@ -209,12 +363,13 @@ class Hct:
     #  * hue and tone.
     #  */
     def set_chroma(self, new_chroma):
-        self.set_internal_state(
-            get_int(self.internal_hue, new_chroma, self.internal_tone)
-        )
+        self.internal_chroma = new_chroma
+        self.argb = None
+        self.measured = False
 
     # /** Lightness. Ranges from 0 to 100. */
     def get_tone(self):
+        self.resolve()
         return self.internal_tone
 
     # /**
@@ -223,16 +378,18 @@ class Hct:
     #  * hue and tone.
     #  */
     def set_tone(self, new_tone):
-        self.set_internal_state(
-            get_int(self.internal_hue, self.internal_chroma, new_tone)
-        )
+        self.internal_tone = new_tone
+        self.argb = None
+        self.measured = False
 
     def set_internal_state(self, argb):
-        cam = Cam16.from_int(argb)
+        hue, chroma, _ = Cam16.hue_chroma_j_from_int(argb)
         tone = lstar_from_argb(argb)
-        self.internal_hue = cam.hue
-        self.internal_chroma = cam.chroma
+        self.internal_hue = hue
+        self.internal_chroma = chroma
         self.internal_tone = tone
+        self.argb = argb
+        self.measured = True
 
     # Adding properties for getters and setters
     hue = property(get_hue, set_hue)
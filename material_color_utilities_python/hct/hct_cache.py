@@ -0,0 +1,107 @@
+import threading
+from collections import OrderedDict
+
+
+# /**
+#  * Counters describing how an HctCache has been used.
+#  */
+class HctCacheStats:
+    def __init__(self, hits, misses, evictions, size, max_entries):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.size = size
+        self.max_entries = max_entries
+
+    # /**
+    #  * Fraction of lookups that were answered from the cache, or 0.0 before
+    #  * the first lookup.
+    #  */
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def __repr__(self):
+        return (
+            f"HctCacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, size={self.size}, "
+            f"max_entries={self.max_entries})"
+        )
+
+
+# /**
+#  * A bounded least-recently-used cache of solved HCT colors.
+#  *
+#  * Keys are the hue, chroma and tone rounded to a multiple of quantization,
+#  * together with the viewing conditions and solver. On a miss the color is
+#  * solved at the quantized hue, chroma and tone, so the result for a key does
+#  * not depend on which request filled it. A quantization of None or 0 keys on
+#  * the exact values instead.
+#  *
+#  * @param max_entries The number of colors kept before the least recently used
+#  *     one is evicted.
+#  * @param quantization Step the hue, chroma and tone are rounded to.
+#  */
+# Using OrderedDict() as replacement for Map()
+class HctCache:
+    def __init__(self, max_entries=4096, quantization=None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.quantization = quantization or None
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def quantize(self, value):
+        if self.quantization is None:
+            return value
+        return round(value / self.quantization) * self.quantization
+
+    # /**
+    #  * Returns the cached color for the given request, calling
+    #  * solve(hue, chroma, tone, viewing_conditions, solver) on a miss.
+    #  */
+    def get_int(self, hue, chroma, tone, viewing_conditions, solver, solve):
+        hue = self.quantize(hue)
+        chroma = self.quantize(chroma)
+        tone = self.quantize(tone)
+        # The viewing conditions are hashed by identity. Keying on the object
+        # rather than id() keeps it alive while its entries are cached, so a
+        # new object can't reuse the id of a collected one.
+        key = (hue, chroma, tone, viewing_conditions, solver)
+        with self.lock:
+            argb = self.entries.get(key)
+            if argb is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return argb
+            self.misses += 1
+        argb = solve(hue, chroma, tone, viewing_conditions, solver)
+        with self.lock:
+            self.entries[key] = argb
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return argb
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        with self.lock:
+            return HctCacheStats(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self.entries),
+                self.max_entries,
+            )
@@ -0,0 +1,307 @@
+# /**
+#  * Batch conversions between ARGB and HCT on NumPy arrays.
+#  *
+#  * These follow the formulas of cam16.py, hct_solver.py and color_utils.py
+#  * step by step, so results match the scalar Hct.from_int and get_int up to
+#  * floating point rounding. NumPy is an optional dependency; install the
+#  * "numpy" extra to use this module.
+#  */
+import math
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "hct_numpy requires NumPy; install material-color-utilities-python[numpy]"
+    ) from e
+
+from material_color_utilities_python.hct.hct_solver import HctSolver
+from material_color_utilities_python.hct.viewing_conditions import (
+    default_viewing_conditions,
+)
+from material_color_utilities_python.utils.color_utils_numpy import (
+    argb_from_linrgb,
+    argb_from_lstar,
+    lstar_from_y,
+    matrix_multiply,
+    xyz_from_argb,
+    y_from_lstar,
+)
+
+_SCALED_DISCOUNT_FROM_LINRGB = np.array(
+    HctSolver.SCALED_DISCOUNT_FROM_LINRGB, dtype=np.float64
+)
+_LINRGB_FROM_SCALED_DISCOUNT = np.array(
+    HctSolver.LINRGB_FROM_SCALED_DISCOUNT, dtype=np.float64
+)
+_CRITICAL_PLANES = np.array(HctSolver.CRITICAL_PLANES, dtype=np.float64)
+_K_R, _K_G, _K_B = HctSolver.Y_FROM_LINRGB
+
+
+# /**
+#  * @param argb Array of colors in ARGB format.
+#  * @return A tuple of float64 arrays (hue, chroma, tone), each shaped like
+#  *     argb, with the HCT coordinates of each color in default viewing
+#  *     conditions.
+#  */
+def hct_from_argb(argb):
+    xyz = xyz_from_argb(argb)
+    hue, chroma, _ = _hue_chroma_j_from_xyz(xyz)
+    tone = lstar_from_y(xyz[1] / 100.0)
+    return hue, chroma, tone
+
+
+# /**
+#  * Batch counterpart of Cam16.hue_chroma_j_from_int.
+#  *
+#  * @param argb Array of colors in ARGB format.
+#  * @return A tuple of float64 arrays (hue, chroma, j), each shaped like argb,
+#  *     with the CAM16 dimensions of each color in default viewing conditions.
+#  */
+def hue_chroma_j_from_argb(argb):
+    return _hue_chroma_j_from_xyz(xyz_from_argb(argb))
+
+
+def _hue_chroma_j_from_xyz(xyz):
+    vc = default_viewing_conditions
+    r_c = 0.401288 * xyz[0] + 0.650173 * xyz[1] - 0.051461 * xyz[2]
+    g_c = -0.250268 * xyz[0] + 1.204414 * xyz[1] + 0.045854 * xyz[2]
+    b_c = -0.002079 * xyz[0] + 0.048952 * xyz[1] + 0.953127 * xyz[2]
+    r_d = vc.rgbD[0] * r_c
+    g_d = vc.rgbD[1] * g_c
+    b_d = vc.rgbD[2] * b_c
+    r_af = np.power((vc.fl * np.abs(r_d)) / 100.0, 0.42)
+    g_af = np.power((vc.fl * np.abs(g_d)) / 100.0, 0.42)
+    b_af = np.power((vc.fl * np.abs(b_d)) / 100.0, 0.42)
+    r_a = (np.sign(r_d) * 400.0 * r_af) / (r_af + 27.13)
+    g_a = (np.sign(g_d) * 400.0 * g_af) / (g_af + 27.13)
+    b_a = (np.sign(b_d) * 400.0 * b_af) / (b_af + 27.13)
+    a = (11.0 * r_a + -12.0 * g_a + b_a) / 11.0
+    b = (r_a + g_a - 2.0 * b_a) / 9.0
+    u = (20.0 * r_a + 20.0 * g_a + 21.0 * b_a) / 20.0
+    p2 = (40.0 * r_a + 20.0 * g_a + b_a) / 20.0
+    atan_degrees = (np.arctan2(b, a) * 180.0) / math.pi
+    hue = np.where(atan_degrees < 0, atan_degrees + 360.0, atan_degrees)
+    hue = np.where(hue >= 360, hue - 360.0, hue)
+    ac = p2 * vc.nbb
+    j = 100.0 * np.power(ac / vc.aw, vc.c * vc.z)
+    hue_prime = np.where(hue < 20.14, hue + 360, hue)
+    e_hue = 0.25 * (np.cos((hue_prime * math.pi) / 180.0 + 2.0) + 3.8)
+    p1 = (50000.0 / 13.0) * e_hue * vc.nc * vc.ncb
+    t = (p1 * np.sqrt(a * a + b * b)) / (u + 0.305)
+    alpha = np.power(t, 0.9) * math.pow(1.64 - math.pow(0.29, vc.n), 0.73)
+    chroma = alpha * np.sqrt(j / 100.0)
+    return hue, chroma, j
+
+
+def _chromatic_adaptation(component):
+    af = np.power(np.abs(component), 0.42)
+    return np.sign(component) * 400.0 * af / (af + 27.13)
+
+
+def _hue_of(linrgb):
+    scaled_discount = matrix_multiply(linrgb, _SCALED_DISCOUNT_FROM_LINRGB)
+    r_a = _chromatic_adaptation(scaled_discount[0])
+    g_a = _chromatic_adaptation(scaled_discount[1])
+    b_a = _chromatic_adaptation(scaled_discount[2])
+    a = (11.0 * r_a + -12.0 * g_a + b_a) / 11.0
+    b = (r_a + g_a - 2.0 * b_a) / 9.0
+    return np.arctan2(b, a)
+
+
+def _sanitize_radians(angle):
+    return (angle + math.pi * 8) % (math.pi * 2)
+
+
+def _are_in_cyclic_order(a, b, c):
+    return _sanitize_radians(b - a) < _sanitize_radians(c - a)
+
+
+def _nth_vertex(y, n):
+    coord_a = 0.0 if n % 4 <= 1 else 100.0
+    coord_b = 0.0 if n % 2 == 0 else 100.0
+    full = np.full_like(y, 1.0)
+    if n < 4:
+        g = coord_a * full
+        b = coord_b * full
+        r = (y - g * _K_G - b * _K_B) / _K_R
+        free = r
+    elif n < 8:
+        b = coord_a * full
+        r = coord_b * full
+        g = (y - r * _K_R - b * _K_B) / _K_G
+        free = g
+    else:
+        r = coord_a * full
+        g = coord_b * full
+        b = (y - r * _K_R - g * _K_G) / _K_B
+        free = b
+    return np.stack([r, g, b]), (0.0 <= free) & (free <= 100.0)
+
+
+def _bisect_to_segment(y, target_hue):
+    left = np.full((3,) + y.shape, -1.0)
+    right = left.copy()
+    left_hue = np.zeros_like(y)
+    right_hue = np.zeros_like(y)
+    initialized = np.zeros(y.shape, dtype=bool)
+    uncut = np.ones(y.shape, dtype=bool)
+    for n in range(12):
+        mid, exists = _nth_vertex(y, n)
+        mid_hue = _hue_of(mid)
+        first = exists & ~initialized
+        left = np.where(first, mid, left)
+        right = np.where(first, mid, right)
+        left_hue = np.where(first, mid_hue, left_hue)
+        right_hue = np.where(first, mid_hue, right_hue)
+        initialized |= exists
+        cut = (
+            exists
+            & ~first
+            & (uncut | _are_in_cyclic_order(left_hue, mid_hue, right_hue))
+        )
+        uncut &= ~cut
+        to_right = cut & _are_in_cyclic_order(left_hue, target_hue, mid_hue)
+        to_left = cut & ~to_right
+        right = np.where(to_right, mid, right)
+        right_hue = np.where(to_right, mid_hue, right_hue)
+        left = np.where(to_left, mid, left)
+        left_hue = np.where(to_left, mid_hue, left_hue)
+    return left, right
+
+
+def _true_delinearized(rgb_component):
+    normalized = rgb_component / 100.0
+    delinearized = np.where(
+        normalized <= 0.0031308,
+        normalized * 12.92,
+        1.055 * np.power(np.maximum(normalized, 0.0031308), 1.0 / 2.4) - 0.055,
+    )
+    return delinearized * 255.0
+
+
+def _bisect_to_limit(y, target_hue):
+    left, right = _bisect_to_segment(y, target_hue)
+    left_hue = _hue_of(left)
+    for axis in range(3):
+        differs = left[axis] != right[axis]
+        increasing = left[axis] < right[axis]
+        left_delinearized = _true_delinearized(left[axis])
+        right_delinearized = _true_delinearized(right[axis])
+        l_plane = np.where(
+            increasing,
+            np.floor(left_delinearized - 0.5),
+            np.ceil(left_delinearized - 0.5),
+        ).astype(np.int64)
+        r_plane = np.where(
+            increasing,
+            np.ceil(right_delinearized - 0.5),
+            np.floor(right_delinearized - 0.5),
+        ).astype(np.int64)
+        for _ in range(8):
+            active = differs & (np.abs(r_plane - l_plane) > 1)
+            if not active.any():
+                break
+            m_plane = (l_plane + r_plane) // 2
+            coordinate = _CRITICAL_PLANES[np.clip(m_plane, 0, 254)]
+            # Inactive elements may divide by zero; their results are discarded.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = (coordinate - left[axis]) / (right[axis] - left[axis])
+                mid = left + (right - left) * t
+                mid_hue = _hue_of(mid)
+            to_right = active & _are_in_cyclic_order(left_hue, target_hue, mid_hue)
+            to_left = active & ~to_right
+            right = np.where(to_right, mid, right)
+            r_plane = np.where(to_right, m_plane, r_plane)
+            left = np.where(to_left, mid, left)
+            left_hue = np.where(to_left, mid_hue, left_hue)
+            l_plane = np.where(to_left, m_plane, l_plane)
+    return (left + right) / 2
+
+
+def _inverse_chromatic_adaptation(adapted):
+    adapted_abs = np.abs(adapted)
+    base = np.maximum(0.0, 27.13 * adapted_abs / (400.0 - adapted_abs))
+    return np.sign(adapted) * np.power(base, 1.0 / 0.42)
+
+
+def _find_result_by_j(hue_radians, chroma, y):
+    # Returns the linear RGB answer and a mask of the elements it was found for.
+    vc = default_viewing_conditions
+    j = np.sqrt(y) * 11.0
+    t_inner_coeff = 1 / math.pow(1.64 - math.pow(0.29, vc.n), 0.73)
+    e_hue = 0.25 * (np.cos(hue_radians + 2.0) + 3.8)
+    p1 = e_hue * (50000.0 / 13.0) * vc.nc * vc.ncb
+    h_sin = np.sin(hue_radians)
+    h_cos = np.cos(hue_radians)
+    answer = np.zeros((3,) + y.shape)
+    found = np.zeros(y.shape, dtype=bool)
+    pending = np.ones(y.shape, dtype=bool)
+    for iteration_round in range(5):
+        j_normalized = j / 100.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            alpha = np.where(
+                (chroma == 0.0) | (j == 0.0), 0.0, chroma / np.sqrt(j_normalized)
+            )
+        t = np.power(alpha * t_inner_coeff, 1.0 / 0.9)
+        ac = vc.aw * np.power(j_normalized, 1.0 / vc.c / vc.z)
+        p2 = ac / vc.nbb
+        gamma = (
+            23.0 * (p2 + 0.305) * t / (23.0 * p1 + 11 * t * h_cos + 108.0 * t * h_sin)
+        )
+        a = gamma * h_cos
+        b = gamma * h_sin
+        r_a = (460.0 * p2 + 451.0 * a + 288.0 * b) / 1403.0
+        g_a = (460.0 * p2 - 891.0 * a - 261.0 * b) / 1403.0
+        b_a = (460.0 * p2 - 220.0 * a - 6300.0 * b) / 1403.0
+        scaled = np.stack(
+            [
+                _inverse_chromatic_adaptation(r_a),
+                _inverse_chromatic_adaptation(g_a),
+                _inverse_chromatic_adaptation(b_a),
+            ]
+        )
+        linrgb = matrix_multiply(scaled, _LINRGB_FROM_SCALED_DISCOUNT)
+        fnj = _K_R * linrgb[0] + _K_G * linrgb[1] + _K_B * linrgb[2]
+        pending &= ~((linrgb < 0).any(axis=0) | (fnj <= 0))
+        done = pending & ((iteration_round == 4) | (np.abs(fnj - y) < 0.002))
+        accepted = done & ~(linrgb > 100.01).any(axis=0)
+        answer = np.where(accepted, linrgb, answer)
+        found |= accepted
+        pending &= ~done
+        if not pending.any():
+            break
+        with np.errstate(divide="ignore", invalid="ignore"):
+            j = np.where(pending, j - (fnj - y) * j / (2 * fnj), j)
+    return answer, found
+
+
+# /**
+#  * @param hue Array of HCT hues, in degrees.
+#  * @param chroma Array of HCT chromas.
+#  * @param tone Array of HCT tones, from 0 to 100.
+#  * @return A uint32 array of ARGB colors, one per broadcast element of the
+#  *     inputs, solved the same way as HctSolver.solve_to_int.
+#  */
+def argb_from_hct(hue, chroma, tone):
+    hue, chroma, tone = np.broadcast_arrays(
+        np.asarray(hue, dtype=np.float64),
+        np.asarray(chroma, dtype=np.float64),
+        np.asarray(tone, dtype=np.float64),
+    )
+    shape = hue.shape
+    hue = hue.ravel()
+    chroma = chroma.ravel()
+    tone = np.clip(tone.ravel(), 0.0, 100.0)
+    result = argb_from_lstar(tone)
+    chromatic = (chroma >= 0.0001) & (tone >= 0.0001) & (tone <= 99.9999)
+    if not chromatic.any():
+        return result.reshape(shape)
+    hue_radians = (hue[chromatic] % 360.0) / 180 * math.pi
+    y = y_from_lstar(tone[chromatic])
+    linrgb, found = _find_result_by_j(hue_radians, chroma[chromatic], y)
+    if not found.all():
+        missing = ~found
+        linrgb[:, missing] = _bisect_to_limit(y[missing], hue_radians[missing])
+    result[chromatic] = argb_from_linrgb(linrgb)
+    return result.reshape(shape)
@@ -0,0 +1,423 @@
+import math
+
+from material_color_utilities_python.hct.cam16 import Cam16
+from material_color_utilities_python.hct.viewing_conditions import (
+    default_viewing_conditions,
+)
+from material_color_utilities_python.utils.color_utils import (
+    DELINEARIZATION_THRESHOLDS,
+    argb_from_linrgb,
+    argb_from_lstar,
+    y_from_lstar,
+)
+from material_color_utilities_python.utils.math_utils import (
+    matrix_multiply,
+    sanitize_degrees_double,
+    signum,
+)
+
+
+# /**
+#  * A class that solves the HCT equation.
+#  *
+#  * Instead of searching over chroma and CAM16 lightness with repeated CAM16
+#  * round trips, the solver inverts CAM16 directly. When the requested color is
+#  * in gamut it is found with a few Newton iterations on J; when it is out of
+#  * gamut, the most chromatic sRGB color with the requested hue and tone is
+#  * found by bisecting the plane of constant Y along the sRGB cube's edges.
+#  */
+# // libmonet is designed to have a consistent API across platforms
+# // and modular components that can be moved around easily. Using a class as a
+# // namespace facilitates this.
+# //
+# // tslint:disable:class-as-namespace
+class HctSolver:
+    SCALED_DISCOUNT_FROM_LINRGB = (
+        (0.001200833568784504, 0.002389694492170889, 0.0002795742885861124),
+        (0.0005891086651375999, 0.0029785502573438758, 0.0003270666104008398),
+        (0.00010146692491640572, 0.0005364214359186694, 0.0032979401770712076),
+    )
+
+    LINRGB_FROM_SCALED_DISCOUNT = (
+        (1373.2198709594231, -1100.4251190754821, -7.278681089101213),
+        (-271.815969077903, 559.6580465940733, -32.46047482791194),
+        (1.9622899599665666, -57.173814538844006, 308.7233197812385),
+    )
+
+    Y_FROM_LINRGB = (0.2126, 0.7152, 0.0722)
+
+    # The linear RGB values at which each 8-bit sRGB component rounds up to the
+    # next value, i.e. linearized(i + 0.5) for i in 0..254.
+    CRITICAL_PLANES = DELINEARIZATION_THRESHOLDS
+
+    # /**
+    #  * Sanitizes a small enough angle in radians.
+    #  *
+    #  * @param angle An angle in radians; must not deviate too much from 0.
+    #  * @return A coterminal angle between 0 and 2pi.
+    #  */
+    @staticmethod
+    def sanitize_radians(angle):
+        return (angle + math.pi * 8) % (math.pi * 2)
+
+    # /**
+    #  * Delinearizes an RGB component, returning a floating-point number.
+    #  *
+    #  * @param rgb_component 0.0 <= rgb_component <= 100.0, represents linear
+    #  *     R/G/B channel
+    #  * @return 0.0 <= output <= 255.0, color channel converted to regular RGB
+    #  *     space
+    #  */
+    @staticmethod
+    def true_delinearized(rgb_component):
+        normalized = rgb_component / 100.0
+        if normalized <= 0.0031308:
+            delinearized = normalized * 12.92
+        else:
+            delinearized = 1.055 * math.pow(normalized, 1.0 / 2.4) - 0.055
+        return delinearized * 255.0
+
+    @staticmethod
+    def chromatic_adaptation(component):
+        af = math.pow(abs(component), 0.42)
+        return signum(component) * 400.0 * af / (af + 27.13)
+
+    # /**
+    #  * Returns the hue of a linear RGB color in CAM16.
+    #  *
+    #  * @param linrgb The linear RGB coordinates of a color.
+    #  * @return The hue of the color in CAM16, in radians.
+    #  */
+    @staticmethod
+    def hue_of(linrgb):
+        scaled_discount = matrix_multiply(linrgb, HctSolver.SCALED_DISCOUNT_FROM_LINRGB)
+        r_a = HctSolver.chromatic_adaptation(scaled_discount[0])
+        g_a = HctSolver.chromatic_adaptation(scaled_discount[1])
+        b_a = HctSolver.chromatic_adaptation(scaled_discount[2])
+        # redness-greenness
+        a = (11.0 * r_a + -12.0 * g_a + b_a) / 11.0
+        # yellowness-blueness
+        b = (r_a + g_a - 2.0 * b_a) / 9.0
+        return math.atan2(b, a)
+
+    @staticmethod
+    def are_in_cyclic_order(a, b, c):
+        delta_a_b = HctSolver.sanitize_radians(b - a)
+        delta_a_c = HctSolver.sanitize_radians(c - a)
+        return delta_a_b < delta_a_c
+
+    # /**
+    #  * Solves the lerp equation.
+    #  *
+    #  * @param source The starting number.
+    #  * @param mid The number in the middle.
+    #  * @param target The ending number.
+    #  * @return A number t such that lerp(source, target, t) = mid.
+    #  */
+    @staticmethod
+    def intercept(source, mid, target):
+        return (mid - source) / (target - source)
+
+    @staticmethod
+    def lerp_point(source, t, target):
+        return [
+            source[0] + (target[0] - source[0]) * t,
+            source[1] + (target[1] - source[1]) * t,
+            source[2] + (target[2] - source[2]) * t,
+        ]
+
+    # /**
+    #  * Intersects a segment with a plane.
+    #  *
+    #  * @param source The coordinates of point A.
+    #  * @param coordinate The R-, G-, or B-coordinate of the plane.
+    #  * @param target The coordinates of point B.
+    #  * @param axis The axis the plane is perpendicular with. (0: R, 1: G, 2: B)
+    #  * @return The intersection point of the segment AB with the plane
+    #  *     R=coordinate, G=coordinate, or B=coordinate
+    #  */
+    @staticmethod
+    def set_coordinate(source, coordinate, target, axis):
+        t = HctSolver.intercept(source[axis], coordinate, target[axis])
+        return HctSolver.lerp_point(source, t, target)
+
+    @staticmethod
+    def is_bounded(x):
+        return 0.0 <= x <= 100.0
+
+    # /**
+    #  * Returns the nth possible vertex of the polygonal intersection.
+    #  *
+    #  * @param y The Y value of the plane.
+    #  * @param n The zero-based index of the point. 0 <= n <= 11.
+    #  * @return The nth possible vertex of the polygonal intersection of the y
+    #  *     plane and the RGB cube, in linear RGB coordinates, if it exists. If
+    #  *     this possible vertex lies outside of the cube, [-1.0, -1.0, -1.0] is
+    #  *     returned.
+    #  */
+    @staticmethod
+    def nth_vertex(y, n):
+        k_r = HctSolver.Y_FROM_LINRGB[0]
+        k_g = HctSolver.Y_FROM_LINRGB[1]
+        k_b = HctSolver.Y_FROM_LINRGB[2]
+        coord_a = 0.0 if n % 4 <= 1 else 100.0
+        coord_b = 0.0 if n % 2 == 0 else 100.0
+        if n < 4:
+            g = coord_a
+            b = coord_b
+            r = (y - g * k_g - b * k_b) / k_r
+            if HctSolver.is_bounded(r):
+                return [r, g, b]
+            return [-1.0, -1.0, -1.0]
+        elif n < 8:
+            b = coord_a
+            r = coord_b
+            g = (y - r * k_r - b * k_b) / k_g
+            if HctSolver.is_bounded(g):
+                return [r, g, b]
+            return [-1.0, -1.0, -1.0]
+        else:
+            r = coord_a
+            g = coord_b
+            b = (y - r * k_r - g * k_g) / k_b
+            if HctSolver.is_bounded(b):
+                return [r, g, b]
+            return [-1.0, -1.0, -1.0]
+
+    # /**
+    #  * Finds the segment containing the desired color.
+    #  *
+    #  * @param y The Y value of the color.
+    #  * @param target_hue The hue of the color.
+    #  * @return A list of two sets of linear RGB coordinates, each corresponding
+    #  *     to an endpoint of the segment containing the desired color.
+    #  */
+    @staticmethod
+    def bisect_to_segment(y, target_hue):
+        left = [-1.0, -1.0, -1.0]
+        right = left
+        left_hue = 0.0
+        right_hue = 0.0
+        initialized = False
+        uncut = True
+        for n in range(12):
+            mid = HctSolver.nth_vertex(y, n)
+            if mid[0] < 0:
+                continue
+            mid_hue = HctSolver.hue_of(mid)
+            if not initialized:
+                left = mid
+                right = mid
+                left_hue = mid_hue
+                right_hue = mid_hue
+                initialized = True
+                continue
+            if uncut or HctSolver.are_in_cyclic_order(left_hue, mid_hue, right_hue):
+                uncut = False
+                if HctSolver.are_in_cyclic_order(left_hue, target_hue, mid_hue):
+                    right = mid
+                    right_hue = mid_hue
+                else:
+                    left = mid
+                    left_hue = mid_hue
+        return [left, right]
+
+    @staticmethod
+    def midpoint(a, b):
+        return [
+            (a[0] + b[0]) / 2,
+            (a[1] + b[1]) / 2,
+            (a[2] + b[2]) / 2,
+        ]
+
+    @staticmethod
+    def critical_plane_below(x):
+        return math.floor(x - 0.5)
+
+    @staticmethod
+    def critical_plane_above(x):
+        return math.ceil(x - 0.5)
+
+    # /**
+    #  * Finds a color with the given Y and hue on the boundary of the cube.
+    #  *
+    #  * @param y The Y value of the color.
+    #  * @param target_hue The hue of the color.
+    #  * @return The desired color, in linear RGB coordinates.
+    #  */
+    @staticmethod
+    def bisect_to_limit(y, target_hue):
+        segment = HctSolver.bisect_to_segment(y, target_hue)
+        left = segment[0]
+        left_hue = HctSolver.hue_of(left)
+        right = segment[1]
+        for axis in range(3):
+            if left[axis] != right[axis]:
+                if left[axis] < right[axis]:
+                    l_plane = HctSolver.critical_plane_below(
+                        HctSolver.true_delinearized(left[axis])
+                    )
+                    r_plane = HctSolver.critical_plane_above(
+                        HctSolver.true_delinearized(right[axis])
+                    )
+                else:
+                    l_plane = HctSolver.critical_plane_above(
+                        HctSolver.true_delinearized(left[axis])
+                    )
+                    r_plane = HctSolver.critical_plane_below(
+                        HctSolver.true_delinearized(right[axis])
+                    )
+                for _ in range(8):
+                    if abs(r_plane - l_plane) <= 1:
+                        break
+                    m_plane = math.floor((l_plane + r_plane) / 2.0)
+                    mid_plane_coordinate = HctSolver.CRITICAL_PLANES[m_plane]
+                    mid = HctSolver.set_coordinate(
+                        left, mid_plane_coordinate, right, axis
+                    )
+                    mid_hue = HctSolver.hue_of(mid)
+                    if HctSolver.are_in_cyclic_order(left_hue, target_hue, mid_hue):
+                        right = mid
+                        r_plane = m_plane
+                    else:
+                        left = mid
+                        left_hue = mid_hue
+                        l_plane = m_plane
+        return HctSolver.midpoint(left, right)
+
+    @staticmethod
+    def inverse_chromatic_adaptation(adapted):
+        adapted_abs = abs(adapted)
+        base = max(0.0, 27.13 * adapted_abs / (400.0 - adapted_abs))
+        return signum(adapted) * math.pow(base, 1.0 / 0.42)
+
+    # /**
+    #  * Finds a color with the given hue, chroma, and Y.
+    #  *
+    #  * @param hue_radians The desired hue in radians.
+    #  * @param chroma The desired chroma.
+    #  * @param y The desired Y.
+    #  * @return The desired color as an ARGB integer, if found; 0 otherwise.
+    #  */
+    @staticmethod
+    def find_result_by_j(hue_radians, chroma, y):
+        # Initial estimate of j.
+        j = math.sqrt(y) * 11.0
+        # ===========================================================
+        # Operations inlined from Cam16 to avoid repeated calculation
+        # ===========================================================
+        viewing_conditions = default_viewing_conditions
+        t_inner_coeff = 1 / math.pow(1.64 - math.pow(0.29, viewing_conditions.n), 0.73)
+        e_hue = 0.25 * (math.cos(hue_radians + 2.0) + 3.8)
+        p1 = e_hue * (50000.0 / 13.0) * viewing_conditions.nc * viewing_conditions.ncb
+        h_sin = math.sin(hue_radians)
+        h_cos = math.cos(hue_radians)
+        for iteration_round in range(5):
+            # ===========================================================
+            # Operations inlined from Cam16 to avoid repeated calculation
+            # ===========================================================
+            j_normalized = j / 100.0
+            alpha = (
+                0.0 if chroma == 0.0 or j == 0.0 else chroma / math.sqrt(j_normalized)
+            )
+            t = math.pow(alpha * t_inner_coeff, 1.0 / 0.9)
+            ac = viewing_conditions.aw * math.pow(
+                j_normalized, 1.0 / viewing_conditions.c / viewing_conditions.z
+            )
+            p2 = ac / viewing_conditions.nbb
+            gamma = (
+                23.0
+                * (p2 + 0.305)
+                * t
+                / (23.0 * p1 + 11 * t * h_cos + 108.0 * t * h_sin)
+            )
+            a = gamma * h_cos
+            b = gamma * h_sin
+            r_a = (460.0 * p2 + 451.0 * a + 288.0 * b) / 1403.0
+            g_a = (460.0 * p2 - 891.0 * a - 261.0 * b) / 1403.0
+            b_a = (460.0 * p2 - 220.0 * a - 6300.0 * b) / 1403.0
+            r_c_scaled = HctSolver.inverse_chromatic_adaptation(r_a)
+            g_c_scaled = HctSolver.inverse_chromatic_adaptation(g_a)
+            b_c_scaled = HctSolver.inverse_chromatic_adaptation(b_a)
+            linrgb = matrix_multiply(
+                [r_c_scaled, g_c_scaled, b_c_scaled],
+                HctSolver.LINRGB_FROM_SCALED_DISCOUNT,
+            )
+            # ===========================================================
+            # Operations inlined from Cam16 to avoid repeated calculation
+            # ===========================================================
+            if linrgb[0] < 0 or linrgb[1] < 0 or linrgb[2] < 0:
+                return 0
+            k_r = HctSolver.Y_FROM_LINRGB[0]
+            k_g = HctSolver.Y_FROM_LINRGB[1]
+            k_b = HctSolver.Y_FROM_LINRGB[2]
+            fnj = k_r * linrgb[0] + k_g * linrgb[1] + k_b * linrgb[2]
+            if fnj <= 0:
+                return 0
+            if iteration_round == 4 or abs(fnj - y) < 0.002:
+                if linrgb[0] > 100.01 or linrgb[1] > 100.01 or linrgb[2] > 100.01:
+                    return 0
+                return argb_from_linrgb(linrgb)
+            # Iterates with Newton method,
+            # Using 2 * fn(j) / j as the approximation of fn'(j)
+            j = j - (fnj - y) * j / (2 * fnj)
+        return 0
+
+    # /**
+    #  * Finds an sRGB color with the given hue, chroma, and L*, if possible.
+    #  *
+    #  * @param hue_degrees The desired hue, in degrees.
+    #  * @param chroma The desired chroma.
+    #  * @param lstar The desired L*.
+    #  * @return A hexadecimal representing the sRGB color. The color has
+    #  *     sufficiently close hue, chroma, and L* to the desired values, if
+    #  *     possible; otherwise, the hue and L* will be sufficiently close, and
+    #  *     chroma will be maximized.
+    #  */
+    @staticmethod
+    def solve_to_int(hue_degrees, chroma, lstar):
+        if chroma < 0.0001 or lstar < 0.0001 or lstar > 99.9999:
+            return argb_from_lstar(lstar)
+        hue_degrees = sanitize_degrees_double(hue_degrees)
+        hue_radians = hue_degrees / 180 * math.pi
+        y = y_from_lstar(lstar)
+        exact_answer = HctSolver.find_result_by_j(hue_radians, chroma, y)
+        if exact_answer != 0:
+            return exact_answer
+        linrgb = HctSolver.bisect_to_limit(y, hue_radians)
+        return argb_from_linrgb(linrgb)
+
+    # /**
+    #  * Finds the most chromatic sRGB color with the given hue and L*.
+    #  *
+    #  * Equivalent to solve_to_int with a chroma beyond the gamut boundary, but
+    #  * skips the attempt to find an exact answer.
+    #  *
+    #  * @param hue_degrees The desired hue, in degrees.
+    #  * @param lstar The desired L*.
+    #  * @return A hexadecimal representing the sRGB color.
+    #  */
+    @staticmethod
+    def solve_max_chroma_to_int(hue_degrees, lstar):
+        if lstar < 0.0001 or lstar > 99.9999:
+            return argb_from_lstar(lstar)
+        hue_degrees = sanitize_degrees_double(hue_degrees)
+        hue_radians = hue_degrees / 180 * math.pi
+        y = y_from_lstar(lstar)
+        linrgb = HctSolver.bisect_to_limit(y, hue_radians)
+        return argb_from_linrgb(linrgb)
+
+    # /**
+    #  * Finds a CAM16 object with the given hue, chroma, and L*, if possible.
+    #  *
+    #  * @param hue_degrees The desired hue, in degrees.
+    #  * @param chroma The desired chroma.
+    #  * @param lstar The desired L*.
+    #  * @return A CAM16 object representing the sRGB color. The color has
+    #  *     sufficiently close hue, chroma, and L* to the desired values, if
+    #  *     possible; otherwise, the hue and L* will be sufficiently close, and
+    #  *     chroma will be maximized.
+    #  */
+    @staticmethod
+    def solve_to_cam(hue_degrees, chroma, lstar):
+        return Cam16.from_int(HctSolver.solve_to_int(hue_degrees, chroma, lstar))
@@ -0,0 +1,169 @@
+# /**
+#  * A memory-mapped lookup table of the HCT and CAM16 dimensions of every opaque
+#  * sRGB color.
+#  *
+#  * The table file starts with a HEADER_SIZE byte header, followed by one record
+#  * per 24-bit RGB value in order. Each record is CHANNEL_COUNT little-endian
+#  * unsigned 16-bit integers: hue, chroma, CAM16 J and tone, each multiplied by
+#  * SCALE and rounded, so looked up values are within 0.005 of the exact ones.
+#  * The file is about 128 MiB and is mapped read-only, so every process that
+#  * opens it shares the same page cache.
+#  *
+#  * Building the table requires NumPy:
+#  *
+#  *     python -m material_color_utilities_python.hct.hct_table path/to/hct.bin
+#  *
+#  * enable_hct_table makes Hct.from_int, Cam16.hue_chroma_j_from_int (in
+#  * default viewing conditions) and lstar_from_argb read from the table.
+#  */
+import mmap
+import struct
+import sys
+
+from material_color_utilities_python.hct import cam16
+from material_color_utilities_python.utils import color_utils
+
+MAGIC = b"MCUHCT01"
+HEADER = struct.Struct("<8sII")
+HEADER_SIZE = 16
+SCALE = 100
+CHANNEL_COUNT = 4
+COLOR_COUNT = 1 << 24
+
+
+# /**
+#  * A read-only view of a table file written by build_hct_table.
+#  *
+#  * @param path Path of the table file.
+#  */
+class HctTable:
+    def __init__(self, path):
+        if sys.byteorder != "little":
+            raise ValueError("HctTable requires a little-endian machine")
+        with open(path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, scale, channel_count = HEADER.unpack_from(self.mmap)
+        expected_size = HEADER_SIZE + COLOR_COUNT * CHANNEL_COUNT * 2
+        if (
+            magic != MAGIC
+            or scale != SCALE
+            or channel_count != CHANNEL_COUNT
+            or len(self.mmap) != expected_size
+        ):
+            self.mmap.close()
+            raise ValueError("not an HCT table file: " + str(path))
+        self.view = memoryview(self.mmap)[HEADER_SIZE:].cast("H")
+
+    # /**
+    #  * @param argb ARGB representation of a color. Alpha is ignored.
+    #  * @return A tuple (hue, chroma, tone).
+    #  */
+    def hct(self, argb):
+        index = (argb & 0xFFFFFF) * CHANNEL_COUNT
+        view = self.view
+        return (
+            view[index] / SCALE,
+            view[index + 1] / SCALE,
+            view[index + 3] / SCALE,
+        )
+
+    # /**
+    #  * @param argb ARGB representation of a color. Alpha is ignored.
+    #  * @return A tuple (hue, chroma, j) in default viewing conditions.
+    #  */
+    def hue_chroma_j(self, argb):
+        index = (argb & 0xFFFFFF) * CHANNEL_COUNT
+        view = self.view
+        return (
+            view[index] / SCALE,
+            view[index + 1] / SCALE,
+            view[index + 2] / SCALE,
+        )
+
+    # /**
+    #  * @param argb ARGB representation of a color. Alpha is ignored.
+    #  * @return L*, from L*a*b*, coordinate of the color.
+    #  */
+    def lstar(self, argb):
+        return self.view[(argb & 0xFFFFFF) * CHANNEL_COUNT + 3] / SCALE
+
+    def close(self):
+        self.view.release()
+        self.mmap.close()
+
+
+# /**
+#  * Computes the table and writes it to path. Requires NumPy.
+#  *
+#  * @param path Where to write the table.
+#  * @param chunk_size How many colors to convert at a time.
+#  */
+def build_hct_table(path, chunk_size=1 << 20):
+    import numpy as np
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, SCALE, CHANNEL_COUNT).ljust(HEADER_SIZE, b"\0"))
+        for start in range(0, COLOR_COUNT, chunk_size):
+            argb = np.arange(
+                start, min(start + chunk_size, COLOR_COUNT), dtype=np.uint32
+            )
+            argb |= np.uint32(0xFF000000)
+            f.write(table_records(argb).tobytes())
+
+
+# /**
+#  * @param argb NumPy array of colors in ARGB format.
+#  * @return The table records of the colors, as a (len(argb), CHANNEL_COUNT)
+#  *     array of little-endian uint16.
+#  */
+def table_records(argb):
+    import numpy as np
+
+    from material_color_utilities_python.hct.hct_numpy import (
+        hct_from_argb,
+        hue_chroma_j_from_argb,
+    )
+
+    hue, chroma, j = hue_chroma_j_from_argb(argb)
+    tone = hct_from_argb(argb)[2]
+    records = np.round(np.stack([hue, chroma, j, tone], axis=-1) * SCALE)
+    # Hues just below 360 round up to 360; wrap them so hue stays in [0, 360).
+    records[:, 0] %= 360 * SCALE
+    return np.clip(records, 0, 0xFFFF).astype("<u2")
+
+
+# The table the lookups read from, or None when disabled.
+active_table = None
+
+
+# /**
+#  * Opens the table at path and makes Hct.from_int, Cam16.hue_chroma_j_from_int
+#  * and lstar_from_argb read from it. Replaces any table enabled before.
+#  *
+#  * @param path Path of a table file written by build_hct_table.
+#  * @return The opened HctTable.
+#  */
+def enable_hct_table(path):
+    global active_table
+    table = HctTable(path)
+    disable_hct_table()
+    active_table = table
+    cam16.hue_chroma_j_lookup = table.hue_chroma_j
+    color_utils.lstar_lookup = table.lstar
+    return table
+
+
+# /**
+#  * Stops reading from the table and closes it.
+#  */
+def disable_hct_table():
+    global active_table
+    cam16.hue_chroma_j_lookup = None
+    color_utils.lstar_lookup = None
+    if active_table is not None:
+        active_table.close()
+        active_table = None
+
+
+if __name__ == "__main__":
+    build_hct_table(sys.argv[1])
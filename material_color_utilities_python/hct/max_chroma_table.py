@@ -0,0 +1,146 @@
+# /**
+#  * A precomputed table of the maximum chroma sRGB can display for each integer
+#  * HCT hue and tone, in default viewing conditions.
+#  *
+#  * The table is stored next to this module as max_chroma.bin: HUE_COUNT rows
+#  * of TONE_COUNT little-endian unsigned 16-bit integers, each holding the
+#  * chroma multiplied by CHROMA_SCALE and rounded up. It is loaded lazily on
+#  * first use. Regenerate it with:
+#  *
+#  *     python -m material_color_utilities_python.hct.max_chroma_table
+#  */
+import math
+import sys
+from array import array
+from pathlib import Path
+
+from material_color_utilities_python.hct.cam16 import Cam16
+from material_color_utilities_python.hct.hct_solver import HctSolver
+from material_color_utilities_python.utils.math_utils import (
+    clamp_double,
+    sanitize_degrees_double,
+)
+
+HUE_COUNT = 360
+TONE_COUNT = 101
+CHROMA_SCALE = 100.0
+
+# /**
+#  * Added to the table's chroma when it is used as an upper bound, to cover the
+#  * sRGB quantization of the boundary colors and the peaks of the gamut
+#  * boundary that fall between grid points.
+#  */
+MAX_CHROMA_MARGIN = 2.0
+
+TABLE_PATH = Path(__file__).with_name("max_chroma.bin")
+
+_table = None
+
+
+def _load_table():
+    global _table
+    if _table is None:
+        table = array("H")
+        try:
+            with open(TABLE_PATH, "rb") as f:
+                table.fromfile(f, HUE_COUNT * TONE_COUNT)
+        except (OSError, EOFError):
+            table = False
+        else:
+            if sys.byteorder == "big":
+                table.byteswap()
+        _table = table
+    return _table
+
+
+def _grid_chroma(table, hue_index, tone_index):
+    return table[(hue_index % HUE_COUNT) * TONE_COUNT + tone_index] / CHROMA_SCALE
+
+
+# /**
+#  * @param hue HCT hue, in degrees.
+#  * @param tone HCT tone, from 0 to 100.
+#  * @return The chroma of the most chromatic sRGB color with the given hue and
+#  *     tone, measured exactly.
+#  */
+def compute_max_chroma(hue, tone):
+    tone = clamp_double(0.0, 100.0, tone)
+    argb = HctSolver.solve_to_int(hue, 200.0, tone)
+    return Cam16.from_int(argb).chroma
+
+
+# /**
+#  * @param hue HCT hue, in degrees.
+#  * @param tone HCT tone, from 0 to 100.
+#  * @return The maximum chroma sRGB can display at the given hue and tone,
+#  *     bilinearly interpolated from the precomputed table. Away from the
+#  *     cusps of the gamut this is within a fraction of a unit of
+#  *     compute_max_chroma; near them it can be off by a few units. Falls back
+#  *     to compute_max_chroma when the table file is unavailable.
+#  */
+def max_chroma(hue, tone):
+    table = _load_table()
+    if not table:
+        return compute_max_chroma(hue, tone)
+    hue = sanitize_degrees_double(hue)
+    tone = clamp_double(0.0, 100.0, tone)
+    hue_index = math.floor(hue)
+    tone_index = min(math.floor(tone), TONE_COUNT - 2)
+    hue_amount = hue - hue_index
+    tone_amount = tone - tone_index
+    low = (1.0 - tone_amount) * _grid_chroma(
+        table, hue_index, tone_index
+    ) + tone_amount * _grid_chroma(table, hue_index, tone_index + 1)
+    high = (1.0 - tone_amount) * _grid_chroma(
+        table, hue_index + 1, tone_index
+    ) + tone_amount * _grid_chroma(table, hue_index + 1, tone_index + 1)
+    return (1.0 - hue_amount) * low + hue_amount * high
+
+
+# /**
+#  * @param hue HCT hue, in degrees.
+#  * @param tone HCT tone, from 0 to 100.
+#  * @return A chroma no color with the given hue and tone can reach, or None
+#  *     when the table file is unavailable. Requests above it are certain to
+#  *     be clipped to the gamut boundary.
+#  */
+def max_chroma_bound(hue, tone):
+    table = _load_table()
+    if not table:
+        return None
+    hue = sanitize_degrees_double(hue)
+    tone = clamp_double(0.0, 100.0, tone)
+    hue_index = math.floor(hue)
+    tone_index = min(math.floor(tone), TONE_COUNT - 2)
+    return (
+        max(
+            _grid_chroma(table, hue_index, tone_index),
+            _grid_chroma(table, hue_index, tone_index + 1),
+            _grid_chroma(table, hue_index + 1, tone_index),
+            _grid_chroma(table, hue_index + 1, tone_index + 1),
+        )
+        + MAX_CHROMA_MARGIN
+    )
+
+
+# /**
+#  * Computes the table and writes it to path.
+#  *
+#  * @param path Where to write the table; defaults to TABLE_PATH.
+#  */
+def build_max_chroma_table(path=TABLE_PATH):
+    global _table
+    table = array("H")
+    for hue in range(HUE_COUNT):
+        for tone in range(TONE_COUNT):
+            chroma = compute_max_chroma(hue, tone)
+            table.append(math.ceil(chroma * CHROMA_SCALE))
+    if sys.byteorder == "big":
+        table.byteswap()
+    with open(path, "wb") as f:
+        table.tofile(f)
+    _table = None
+
+
+if __name__ == "__main__":
+    build_max_chroma_table()
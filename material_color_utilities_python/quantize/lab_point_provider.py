@@ -2,7 +2,19 @@
 #  * Provides conversions needed for K-Means quantization. Converting input to
 #  * points, and converting the final state of the K-Means algorithm to colors.
 #  */
-from material_color_utilities_python.utils.color_utils import argb_from_lab
+from material_color_utilities_python.utils.color_utils import (
+    argb_from_lab,
+    lab_from_argb,
+)
+
+
+# /**
+#  * Convert a color represented in ARGB to a 3-element array of L*, a*, b*
+#  * coordinates of the color.
+#  */
+def lab_from_int(argb):
+    return lab_from_argb(argb)
+
 
 # /**
 #  * Convert a 3-element array to a color represented in ARGB.
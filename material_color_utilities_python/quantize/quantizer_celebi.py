@@ -1,5 +1,28 @@
-from material_color_utilities_python.quantize.quantizer_wsmeans import QuantizerWsMeans
-from material_color_utilities_python.quantize.quantizer_wu import QuantizerWu
+from material_color_utilities_python.quantize.quantizer_map import QuantizerMap
+from material_color_utilities_python.quantize.quantizer_wsmeans import (
+    MAX_ITERATIONS,
+    MIN_MOVEMENT_DISTANCE,
+    QuantizerWsMeans,
+)
+from material_color_utilities_python.quantize.quantizer_wsmeans_minibatch import (
+    QuantizerWsMeansMiniBatch,
+)
+from material_color_utilities_python.quantize.quantizer_wu import (
+    INDEX_BITS,
+    QuantizerWu,
+)
+
+try:
+    # Same results, with the heavy loops computed by NumPy.
+    from material_color_utilities_python.quantize.quantizer_wsmeans_numpy import (
+        QuantizerWsMeansNumpy as DefaultQuantizerWsMeans,
+    )
+    from material_color_utilities_python.quantize.quantizer_wu_numpy import (
+        QuantizerWuNumpy as DefaultQuantizerWu,
+    )
+except ImportError:
+    DefaultQuantizerWsMeans = QuantizerWsMeans
+    DefaultQuantizerWu = QuantizerWu
 
 
 # /**
@@ -20,15 +43,121 @@ from material_color_utilities_python.quantize.quantizer_wu import QuantizerWu
 # // tslint:disable-next-line:class-as-namespace
 class QuantizerCelebi:
     # /**
-    #  * @param pixels Colors in ARGB format.
+    #  * @param pixels Colors in ARGB format. Colors that are not opaque are
+    #  *     ignored.
+    #  * @param maxColors The number of colors to divide the image into. A lower
+    #  *     number of colors may be returned.
+    #  * @param index_bits Histogram resolution of the Wu stage, see QuantizerWu.
+    #  * @param max_iterations, min_movement_distance, on_iteration Control and
+    #  *     report the K-Means stage, see QuantizerWsMeans.quantize.
+    #  * @param batch_size If set, inputs with more distinct colors than this
+    #  *     are refined by QuantizerWsMeansMiniBatch with batches of this many
+    #  *     pixels, and min_movement_distance is not used.
+    #  * @return Map with keys of colors in ARGB format, and values of number of
+    #  *     pixels in the original image that correspond to the color in the
+    #  *     quantized image.
+    #  */
+    @staticmethod
+    def quantize(
+        pixels,
+        max_colors,
+        index_bits=INDEX_BITS,
+        max_iterations=MAX_ITERATIONS,
+        min_movement_distance=MIN_MOVEMENT_DISTANCE,
+        on_iteration=None,
+        batch_size=None,
+    ):
+        return QuantizerCelebi.quantize_histogram(
+            QuantizerMap.quantize(pixels),
+            max_colors,
+            index_bits,
+            max_iterations,
+            min_movement_distance,
+            on_iteration,
+            batch_size,
+        )
+
+    # /**
+    #  * @param countByColor Map with keys of opaque colors in ARGB format, and
+    #  *     values of the number of pixels of that color, such as the result of
+    #  *     QuantizerMap.quantize or image_utils.get_argb_histogram.
+    #  * @param maxColors The number of colors to divide the image into. A lower
+    #  *     number of colors may be returned.
+    #  * @param index_bits Histogram resolution of the Wu stage, see QuantizerWu.
+    #  * @param max_iterations, min_movement_distance, on_iteration Control and
+    #  *     report the K-Means stage, see QuantizerWsMeans.quantize.
+    #  * @param batch_size If set, inputs with more distinct colors than this
+    #  *     are refined by QuantizerWsMeansMiniBatch with batches of this many
+    #  *     pixels, and min_movement_distance is not used.
+    #  * @return Map with keys of colors in ARGB format, and values of number of
+    #  *     pixels in the original image that correspond to the color in the
+    #  *     quantized image.
+    #  */
+    @staticmethod
+    def quantize_histogram(
+        count_by_color,
+        max_colors,
+        index_bits=INDEX_BITS,
+        max_iterations=MAX_ITERATIONS,
+        min_movement_distance=MIN_MOVEMENT_DISTANCE,
+        on_iteration=None,
+        batch_size=None,
+    ):
+        return QuantizerCelebi.quantize_counts(
+            list(count_by_color.keys()),
+            list(count_by_color.values()),
+            max_colors,
+            index_bits,
+            max_iterations,
+            min_movement_distance,
+            on_iteration,
+            batch_size,
+        )
+
+    # /**
+    #  * @param colors Distinct opaque colors in ARGB format.
+    #  * @param counts The number of pixels of each color, parallel to colors.
     #  * @param maxColors The number of colors to divide the image into. A lower
     #  *     number of colors may be returned.
+    #  * @param index_bits Histogram resolution of the Wu stage, see QuantizerWu.
+    #  * @param max_iterations, min_movement_distance, on_iteration Control and
+    #  *     report the K-Means stage, see QuantizerWsMeans.quantize.
+    #  * @param batch_size If set, inputs with more distinct colors than this
+    #  *     are refined by QuantizerWsMeansMiniBatch with batches of this many
+    #  *     pixels, and min_movement_distance is not used.
     #  * @return Map with keys of colors in ARGB format, and values of number of
     #  *     pixels in the original image that correspond to the color in the
     #  *     quantized image.
     #  */
     @staticmethod
-    def quantize(pixels, max_colors):
-        wu = QuantizerWu()
-        wu_result = wu.quantize(pixels, max_colors)
-        return QuantizerWsMeans.quantize(pixels, wu_result, max_colors)
+    def quantize_counts(
+        colors,
+        counts,
+        max_colors,
+        index_bits=INDEX_BITS,
+        max_iterations=MAX_ITERATIONS,
+        min_movement_distance=MIN_MOVEMENT_DISTANCE,
+        on_iteration=None,
+        batch_size=None,
+    ):
+        wu = DefaultQuantizerWu(index_bits=index_bits)
+        wu_result = wu.quantize_counts(colors, counts, max_colors)
+        if batch_size is not None and len(colors) > batch_size:
+            return QuantizerWsMeansMiniBatch.quantize_counts(
+                colors,
+                counts,
+                wu_result,
+                max_colors,
+                batch_size,
+                max_iterations,
+                on_iteration,
+            )
+        return DefaultQuantizerWsMeans.quantize_counts(
+            colors,
+            counts,
+            wu_result,
+            max_colors,
+            max_iterations,
+            min_movement_distance,
+            on_iteration,
+        )
@@ -1,17 +1,53 @@
 import math
 import random
+import time
 from collections import OrderedDict
 
 from material_color_utilities_python.quantize.lab_point_provider import (
     lab_distance,
+    lab_from_int,
     lab_to_int,
 )
-from material_color_utilities_python.utils.color_utils import lab_from_argb
 
 MAX_ITERATIONS = 10
 MIN_MOVEMENT_DISTANCE = 3.0
 
 
+# /**
+#  * What one iteration of QuantizerWsMeans did, as passed to on_iteration.
+#  *
+#  * @param iteration Index of the iteration, starting at 0.
+#  * @param points_moved Number of distinct colors that changed cluster.
+#  * @param cost Sum over all pixels of the squared Lab distance to their
+#  *     cluster, after the points were reassigned.
+#  * @param centroid_shift Largest Lab distance a cluster center moved when the
+#  *     clusters were recomputed; 0.0 for the iteration that converged, as the
+#  *     clusters are not recomputed.
+#  * @param elapsed Seconds spent in the iteration.
+#  */
+class IterationStats:
+    def __init__(self, iteration, points_moved, cost, centroid_shift, elapsed):
+        self.iteration = iteration
+        self.points_moved = points_moved
+        self.cost = cost
+        self.centroid_shift = centroid_shift
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return (
+            f"IterationStats(iteration={self.iteration}, "
+            f"points_moved={self.points_moved}, cost={self.cost!r}, "
+            f"centroid_shift={self.centroid_shift!r}, elapsed={self.elapsed!r})"
+        )
+
+
+def check_iteration_options(max_iterations, min_movement_distance):
+    if max_iterations < 1:
+        raise ValueError("max_iterations must be at least 1")
+    if min_movement_distance < 0:
+        raise ValueError("min_movement_distance must not be negative")
+
+
 # /**
 #  * An image quantizer that improves on the speed of a standard K-Means algorithm
 #  * by implementing several optimizations, including deduping identical pixels
@@ -39,74 +75,113 @@ class QuantizerWsMeans:
     #  *     quality results.
     #  * @param maxColors The number of colors to divide the image into. A lower
     #  *     number of colors may be returned.
+    #  * @param max_iterations Largest number of iterations to run.
+    #  * @param min_movement_distance A point only moves to a closer cluster if
+    #  *     its distance to the cluster shrinks by more than this.
+    #  * @param on_iteration Optional function called with an IterationStats
+    #  *     after each iteration.
     #  * @return Colors in ARGB format.
     #  */
     # Replacing Map() with OrderedDict()
     @staticmethod
-    def quantize(input_pixels, starting_clusters, max_colors):
-        random.seed(69)
+    def quantize(
+        input_pixels,
+        starting_clusters,
+        max_colors,
+        max_iterations=MAX_ITERATIONS,
+        min_movement_distance=MIN_MOVEMENT_DISTANCE,
+        on_iteration=None,
+    ):
         pixel_to_count = OrderedDict()
-        points = []
-        pixels = []
-        point_count = 0
         for i in range(len(input_pixels)):
             input_pixel = input_pixels[i]
             if input_pixel not in pixel_to_count.keys():
-                point_count += 1
-                points.append(lab_from_argb(input_pixel))
-                pixels.append(input_pixel)
                 pixel_to_count[input_pixel] = 1
             else:
                 pixel_to_count[input_pixel] = pixel_to_count[input_pixel] + 1
-        counts = []
-        for i in range(point_count):
-            pixel = pixels[i]
-            if pixel in pixel_to_count.keys():
-                # counts[i] = pixel_to_count[pixel]
-                counts.append(pixel_to_count[pixel])
-        cluster_count = min(max_colors, point_count)
-        if len(starting_clusters) > 0:
-            cluster_count = min(cluster_count, len(starting_clusters))
-        clusters = []
-        for i in range(len(starting_clusters)):
-            clusters.append(lab_from_argb(starting_clusters[i]))
-        additional_clusters_needed = cluster_count - len(clusters)
-        if len(starting_clusters) == 0 and additional_clusters_needed > 0:
-            for i in range(additional_clusters_needed):
-                lightness = random.uniform(0, 1) * 100.0
-                a = random.uniform(0, 1) * (100.0 - (-100.0) + 1) + -100
-                b = random.uniform(0, 1) * (100.0 - (-100.0) + 1) + -100
-                clusters.append([lightness, a, b])
-        cluster_indices = []
-        for i in range(point_count):
-            cluster_indices.append(math.floor(random.uniform(0, 1) * cluster_count))
-        index_matrix = []
-        for i in range(cluster_count):
-            index_matrix.append([])
-            for j in range(cluster_count):
-                index_matrix[i].append(0)
-        distance_to_index_matrix = []
-        for i in range(cluster_count):
-            distance_to_index_matrix.append([])
-            for j in range(cluster_count):
-                distance_to_index_matrix[i].append(DistanceAndIndex())
+        return QuantizerWsMeans.quantize_histogram(
+            pixel_to_count,
+            starting_clusters,
+            max_colors,
+            max_iterations,
+            min_movement_distance,
+            on_iteration,
+        )
+
+    # /**
+    #  * @param pixelToCount Map with keys of colors in ARGB format, and values of
+    #  *     the number of pixels of that color. Results are reproducible for the
+    #  *     same map in the same iteration order.
+    #  * @param startingClusters Defines the initial state of the quantizer, as
+    #  *     in quantize.
+    #  * @param maxColors The number of colors to divide the image into. A lower
+    #  *     number of colors may be returned.
+    #  * @return Colors in ARGB format.
+    #  *
+    #  * The other parameters are as in quantize.
+    #  */
+    @staticmethod
+    def quantize_histogram(
+        pixel_to_count,
+        starting_clusters,
+        max_colors,
+        max_iterations=MAX_ITERATIONS,
+        min_movement_distance=MIN_MOVEMENT_DISTANCE,
+        on_iteration=None,
+    ):
+        return QuantizerWsMeans.quantize_counts(
+            pixel_to_count.keys(),
+            pixel_to_count.values(),
+            starting_clusters,
+            max_colors,
+            max_iterations,
+            min_movement_distance,
+            on_iteration,
+        )
+
+    # /**
+    #  * @param colors Distinct colors in ARGB format.
+    #  * @param counts The number of pixels of each color, parallel to colors.
+    #  * @param startingClusters Defines the initial state of the quantizer, as
+    #  *     in quantize.
+    #  * @param maxColors The number of colors to divide the image into. A lower
+    #  *     number of colors may be returned.
+    #  * @return Colors in ARGB format.
+    #  *
+    #  * The other parameters are as in quantize.
+    #  */
+    @staticmethod
+    def quantize_counts(
+        colors,
+        counts,
+        starting_clusters,
+        max_colors,
+        max_iterations=MAX_ITERATIONS,
+        min_movement_distance=MIN_MOVEMENT_DISTANCE,
+        on_iteration=None,
+    ):
+        check_iteration_options(max_iterations, min_movement_distance)
+        points, counts, clusters, cluster_indices = QuantizerWsMeans.initial_state(
+            colors, counts, starting_clusters, max_colors
+        )
+        point_count = len(points)
+        cluster_count = len(clusters)
         pixel_count_sums = []
         for i in range(cluster_count):
             pixel_count_sums.append(0)
-        for iteration in range(MAX_ITERATIONS):
+        for iteration in range(max_iterations):
+            start_time = time.perf_counter()
+            # Each cluster's neighbours as (distance, index), closest first.
+            neighbors = [[] for _ in range(cluster_count)]
             for i in range(cluster_count):
                 for j in range(i + 1, cluster_count):
                     distance = lab_distance(clusters[i], clusters[j])
-                    distance_to_index_matrix[j][i].distance = distance
-                    distance_to_index_matrix[j][i].index = i
-                    distance_to_index_matrix[i][j].distance = distance
-                    distance_to_index_matrix[i][j].index = j
-                # This sort here doesn't seem to do anything because arr of objects
-                # leaving just in case though
-                # distance_to_index_matrix[i].sort()
-                for j in range(cluster_count):
-                    index_matrix[i][j] = distance_to_index_matrix[i][j].index
+                    neighbors[i].append((distance, j))
+                    neighbors[j].append((distance, i))
+            for row in neighbors:
+                row.sort()
             points_moved = 0
+            cost = 0.0
             for i in range(point_count):
                 point = points[i]
                 previous_cluster_index = cluster_indices[i]
@@ -114,12 +189,12 @@ class QuantizerWsMeans:
                 previous_distance = lab_distance(point, previous_cluster)
                 minimum_distance = previous_distance
                 new_cluster_index = -1
-                for j in range(cluster_count):
-                    if (
-                        distance_to_index_matrix[previous_cluster_index][j].distance
-                        >= 4 * previous_distance
-                    ):
-                        continue
+                # By the triangle inequality, a cluster at least twice as far
+                # from the current cluster as the point is can't be closer to
+                # the point, and neither can any neighbour after it.
+                for neighbor_distance, j in neighbors[previous_cluster_index]:
+                    if neighbor_distance >= 4 * previous_distance:
+                        break
                     distance = lab_distance(point, clusters[j])
                     if distance < minimum_distance:
                         minimum_distance = distance
@@ -128,10 +203,18 @@ class QuantizerWsMeans:
                     distance_change = abs(
                         (math.sqrt(minimum_distance) - math.sqrt(previous_distance))
                     )
-                    if distance_change > MIN_MOVEMENT_DISTANCE:
+                    if distance_change > min_movement_distance:
                         points_moved += 1
                         cluster_indices[i] = new_cluster_index
+                        previous_distance = minimum_distance
+                cost += counts[i] * previous_distance
             if points_moved == 0 and iteration != 0:
+                if on_iteration is not None:
+                    on_iteration(
+                        IterationStats(
+                            iteration, 0, cost, 0.0, time.perf_counter() - start_time
+                        )
+                    )
                 break
             component_a_sums = [0] * cluster_count
             component_b_sums = [0] * cluster_count
@@ -146,17 +229,71 @@ class QuantizerWsMeans:
                 component_a_sums[cluster_index] += point[0] * count
                 component_b_sums[cluster_index] += point[1] * count
                 component_c_sums[cluster_index] += point[2] * count
+            centroid_shift = 0.0
             for i in range(cluster_count):
                 count = pixel_count_sums[i]
                 if count == 0:
-                    clusters[i] = [0.0, 0.0, 0.0]
-                    continue
-                a = component_a_sums[i] / count
-                b = component_b_sums[i] / count
-                c = component_c_sums[i] / count
-                clusters[i] = [a, b, c]
+                    cluster = [0.0, 0.0, 0.0]
+                else:
+                    a = component_a_sums[i] / count
+                    b = component_b_sums[i] / count
+                    c = component_c_sums[i] / count
+                    cluster = [a, b, c]
+                centroid_shift = max(centroid_shift, lab_distance(clusters[i], cluster))
+                clusters[i] = cluster
+            if on_iteration is not None:
+                on_iteration(
+                    IterationStats(
+                        iteration,
+                        points_moved,
+                        cost,
+                        math.sqrt(centroid_shift),
+                        time.perf_counter() - start_time,
+                    )
+                )
+        return QuantizerWsMeans.population_by_color(clusters, pixel_count_sums)
+
+    # /**
+    #  * Converts the input to Lab points and picks the starting clusters and the
+    #  * starting cluster of each point. Reseeds the random number generator, so
+    #  * the state is the same for the same input.
+    #  *
+    #  * @return A tuple (points, counts, clusters, cluster_indices), where
+    #  *     clusters holds exactly the clusters used.
+    #  */
+    @staticmethod
+    def initial_state(colors, counts, starting_clusters, max_colors):
+        random.seed(69)
+        points = [lab_from_int(color) for color in colors]
+        counts = list(counts)
+        point_count = len(points)
+        cluster_count = min(max_colors, point_count)
+        if len(starting_clusters) > 0:
+            cluster_count = min(cluster_count, len(starting_clusters))
+        clusters = []
+        for i in range(cluster_count if len(starting_clusters) > 0 else 0):
+            clusters.append(lab_from_int(starting_clusters[i]))
+        additional_clusters_needed = cluster_count - len(clusters)
+        if len(starting_clusters) == 0 and additional_clusters_needed > 0:
+            for i in range(additional_clusters_needed):
+                lightness = random.uniform(0, 1) * 100.0
+                a = random.uniform(0, 1) * (100.0 - (-100.0) + 1) + -100
+                b = random.uniform(0, 1) * (100.0 - (-100.0) + 1) + -100
+                clusters.append([lightness, a, b])
+        cluster_indices = []
+        for i in range(point_count):
+            cluster_indices.append(math.floor(random.uniform(0, 1) * cluster_count))
+        return points, counts, clusters, cluster_indices
+
+    # /**
+    #  * @return Map with keys of the final clusters in ARGB format, and values
+    #  *     of the number of pixels in each. Empty clusters are left out, and a
+    #  *     color reached by two clusters keeps the count of the first.
+    #  */
+    @staticmethod
+    def population_by_color(clusters, pixel_count_sums):
         argb_to_population = OrderedDict()
-        for i in range(cluster_count):
+        for i in range(len(clusters)):
             count = pixel_count_sums[i]
             if count == 0:
                 continue
@@ -165,12 +302,3 @@ class QuantizerWsMeans:
                 continue
             argb_to_population[possible_new_cluster] = count
         return argb_to_population
-
-
-# /**
-#  *  A wrapper for maintaining a table of distances between K-Means clusters.
-#  */
-class DistanceAndIndex:
-    def __init__(self):
-        self.distance = -1
-        self.index = -1
@@ -0,0 +1,259 @@
+# /**
+#  * Mini-batch K-Means for inputs with many distinct colors.
+#  *
+#  * Each iteration of QuantizerWsMeans visits every distinct color, so its
+#  * latency grows with the color diversity of the image. This quantizer
+#  * instead draws batch_size pixels per iteration, each color with a chance
+#  * proportional to its count, and moves every cluster to the running mean of
+#  * the samples it has received (D. Sculley, Web-Scale K-Means Clustering,
+#  * 2010). The populations returned are estimated from a final, larger sample,
+#  * so the work per call depends on batch_size and max_iterations rather than
+#  * on the number of distinct colors.
+#  *
+#  * Samples are drawn from a generator with a fixed seed, so results are
+#  * reproducible for the same input in the same order. Inputs with at most
+#  * batch_size distinct colors are handed to QuantizerWsMeans unchanged.
+#  */
+import math
+import random
+import time
+from collections import OrderedDict
+from itertools import accumulate
+
+from material_color_utilities_python.quantize.lab_point_provider import (
+    lab_distance,
+    lab_from_int,
+)
+from material_color_utilities_python.quantize.quantizer_wsmeans import (
+    MAX_ITERATIONS,
+    IterationStats,
+    QuantizerWsMeans,
+    check_iteration_options,
+)
+
+DEFAULT_BATCH_SIZE = 2048
+
+# Size of the sample the populations are estimated from, in batches.
+POPULATION_BATCHES = 4
+
+SEED = 69
+
+
+# /**
+#  * The index of the cluster closest to point and its squared distance,
+#  * searching the neighbours of clusters[start] closest first. Exact for any
+#  * start; the closer start is to point, the fewer clusters are compared.
+#  */
+def nearest_cluster(point, start, clusters, neighbors):
+    start_distance = lab_distance(point, clusters[start])
+    minimum_distance = start_distance
+    nearest = start
+    for neighbor_distance, j in neighbors[start]:
+        # By the triangle inequality, no cluster from here on can be closer
+        # to the point than clusters[start] is.
+        if neighbor_distance >= 4 * start_distance:
+            break
+        distance = lab_distance(point, clusters[j])
+        if distance < minimum_distance:
+            minimum_distance = distance
+            nearest = j
+    return nearest, minimum_distance
+
+
+def sorted_neighbors(clusters):
+    cluster_count = len(clusters)
+    neighbors = [[] for _ in range(cluster_count)]
+    for i in range(cluster_count):
+        for j in range(i + 1, cluster_count):
+            distance = lab_distance(clusters[i], clusters[j])
+            neighbors[i].append((distance, j))
+            neighbors[j].append((distance, i))
+    for row in neighbors:
+        row.sort()
+    return neighbors
+
+
+class QuantizerWsMeansMiniBatch:
+    # /**
+    #  * @param inputPixels Colors in ARGB format.
+    #  * @param startingClusters Defines the initial state of the quantizer, as
+    #  *     in QuantizerWsMeans.quantize.
+    #  * @param maxColors The number of colors to divide the image into. A lower
+    #  *     number of colors may be returned.
+    #  * @param batch_size Number of pixels sampled per iteration.
+    #  * @param max_iterations Number of batches.
+    #  * @param on_iteration Optional function called with an IterationStats
+    #  *     after each batch. Its points_moved counts sampled colors that went
+    #  *     to another cluster than when last sampled, and its cost is the sum
+    #  *     of the squared distances of the batch.
+    #  * @return Colors in ARGB format.
+    #  */
+    @staticmethod
+    def quantize(
+        input_pixels,
+        starting_clusters,
+        max_colors,
+        batch_size=DEFAULT_BATCH_SIZE,
+        max_iterations=MAX_ITERATIONS,
+        on_iteration=None,
+    ):
+        pixel_to_count = OrderedDict()
+        for input_pixel in input_pixels:
+            pixel_to_count[input_pixel] = pixel_to_count.get(input_pixel, 0) + 1
+        return QuantizerWsMeansMiniBatch.quantize_histogram(
+            pixel_to_count,
+            starting_clusters,
+            max_colors,
+            batch_size,
+            max_iterations,
+            on_iteration,
+        )
+
+    # /**
+    #  * Same as quantize, for a map of colors to pixel counts.
+    #  */
+    @staticmethod
+    def quantize_histogram(
+        pixel_to_count,
+        starting_clusters,
+        max_colors,
+        batch_size=DEFAULT_BATCH_SIZE,
+        max_iterations=MAX_ITERATIONS,
+        on_iteration=None,
+    ):
+        return QuantizerWsMeansMiniBatch.quantize_counts(
+            pixel_to_count.keys(),
+            pixel_to_count.values(),
+            starting_clusters,
+            max_colors,
+            batch_size,
+            max_iterations,
+            on_iteration,
+        )
+
+    # /**
+    #  * Same as quantize, for parallel sequences of distinct colors and their
+    #  * pixel counts.
+    #  */
+    @staticmethod
+    def quantize_counts(
+        colors,
+        counts,
+        starting_clusters,
+        max_colors,
+        batch_size=DEFAULT_BATCH_SIZE,
+        max_iterations=MAX_ITERATIONS,
+        on_iteration=None,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        check_iteration_options(max_iterations, 0.0)
+        colors = list(colors)
+        counts = list(counts)
+        if len(colors) <= batch_size:
+            return QuantizerWsMeans.quantize_counts(
+                colors,
+                counts,
+                starting_clusters,
+                max_colors,
+                max_iterations,
+                on_iteration=on_iteration,
+            )
+        rng = random.Random(SEED)
+        cluster_count = min(max_colors, len(colors))
+        if len(starting_clusters) > 0:
+            cluster_count = min(cluster_count, len(starting_clusters))
+            clusters = [
+                lab_from_int(starting_clusters[i]) for i in range(cluster_count)
+            ]
+        else:
+            clusters = []
+            for i in range(cluster_count):
+                lightness = rng.uniform(0, 1) * 100.0
+                a = rng.uniform(0, 1) * (100.0 - (-100.0) + 1) + -100
+                b = rng.uniform(0, 1) * (100.0 - (-100.0) + 1) + -100
+                clusters.append([lightness, a, b])
+        if cluster_count == 0:
+            return OrderedDict()
+        cumulative_counts = list(accumulate(counts))
+        population = range(len(colors))
+        # Lab points and last cluster of the colors sampled so far, by index.
+        points = {}
+        last_cluster = {}
+
+        def assign(samples, neighbors):
+            moved = 0
+            cost = 0.0
+            assignments = []
+            for index in samples:
+                point = points.get(index)
+                if point is None:
+                    point = lab_from_int(colors[index])
+                    points[index] = point
+                previous = last_cluster.get(index)
+                cluster_index, distance = nearest_cluster(
+                    point, 0 if previous is None else previous, clusters, neighbors
+                )
+                if previous is not None and previous != cluster_index:
+                    moved += 1
+                last_cluster[index] = cluster_index
+                cost += distance
+                assignments.append((point, cluster_index))
+            return assignments, moved, cost
+
+        cluster_weights = [0] * cluster_count
+        for iteration in range(max_iterations):
+            start_time = time.perf_counter()
+            samples = rng.choices(
+                population, cum_weights=cumulative_counts, k=batch_size
+            )
+            assignments, points_moved, cost = assign(
+                samples, sorted_neighbors(clusters)
+            )
+            component_a_sums = [0.0] * cluster_count
+            component_b_sums = [0.0] * cluster_count
+            component_c_sums = [0.0] * cluster_count
+            batch_counts = [0] * cluster_count
+            for point, cluster_index in assignments:
+                batch_counts[cluster_index] += 1
+                component_a_sums[cluster_index] += point[0]
+                component_b_sums[cluster_index] += point[1]
+                component_c_sums[cluster_index] += point[2]
+            centroid_shift = 0.0
+            for i in range(cluster_count):
+                count = batch_counts[i]
+                if count == 0:
+                    continue
+                # Moves the cluster to the mean of every sample it received,
+                # in this batch and all earlier ones.
+                weight = cluster_weights[i]
+                total = weight + count
+                cluster = clusters[i]
+                new_cluster = [
+                    (cluster[0] * weight + component_a_sums[i]) / total,
+                    (cluster[1] * weight + component_b_sums[i]) / total,
+                    (cluster[2] * weight + component_c_sums[i]) / total,
+                ]
+                centroid_shift = max(centroid_shift, lab_distance(cluster, new_cluster))
+                clusters[i] = new_cluster
+                cluster_weights[i] = total
+            if on_iteration is not None:
+                on_iteration(
+                    IterationStats(
+                        iteration,
+                        points_moved,
+                        cost,
+                        math.sqrt(centroid_shift),
+                        time.perf_counter() - start_time,
+                    )
+                )
+
+        sample_size = batch_size * POPULATION_BATCHES
+        samples = rng.choices(population, cum_weights=cumulative_counts, k=sample_size)
+        assignments, _, _ = assign(samples, sorted_neighbors(clusters))
+        hits = [0] * cluster_count
+        for _, cluster_index in assignments:
+            hits[cluster_index] += 1
+        pixel_count = cumulative_counts[-1]
+        pixel_count_sums = [round(hit * pixel_count / sample_size) for hit in hits]
+        return QuantizerWsMeans.population_by_color(clusters, pixel_count_sums)
@@ -0,0 +1,209 @@
+# /**
+#  * QuantizerWsMeans with the assignment and update steps computed on NumPy
+#  * arrays.
+#  *
+#  * Starts from the same state as QuantizerWsMeans and applies the same rules.
+#  * A point only considers clusters closer to its current cluster than twice
+#  * its own distance to it, the set QuantizerWsMeans visits in its sorted
+#  * neighbour list before stopping at the triangle inequality bound. It moves
+#  * to the strictly closest of those, ties going to the cluster that comes
+#  * first in that neighbour list, and only moves longer than
+#  * min_movement_distance count. Distances and centroid sums are evaluated
+#  * with the same floating point operations in the same order, so the results
+#  * match QuantizerWsMeans. NumPy is an optional dependency; install the
+#  * "numpy" extra to use this module.
+#  */
+import time
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "quantizer_wsmeans_numpy requires NumPy; "
+        "install material-color-utilities-python[numpy]"
+    ) from e
+
+from material_color_utilities_python.quantize.quantizer_wsmeans import (
+    MAX_ITERATIONS,
+    MIN_MOVEMENT_DISTANCE,
+    IterationStats,
+    QuantizerWsMeans,
+    check_iteration_options,
+)
+
+# Number of points whose distances to every cluster are computed at once.
+BLOCK_SIZE = 4096
+
+
+# /**
+#  * Squared distance of every point to every cluster, with the same operations
+#  * as lab_distance. Both arguments are (3, n) arrays of L*, a* and b* rows.
+#  */
+def squared_distances(points, clusters):
+    distances = np.subtract.outer(points[0], clusters[0])
+    distances *= distances
+    for axis in (1, 2):
+        difference = np.subtract.outer(points[axis], clusters[axis])
+        difference *= difference
+        distances += difference
+    return distances
+
+
+class QuantizerWsMeansNumpy(QuantizerWsMeans):
+    # /**
+    #  * Same as QuantizerWsMeans.quantize.
+    #  */
+    @staticmethod
+    def quantize(
+        input_pixels,
+        starting_clusters,
+        max_colors,
+        max_iterations=MAX_ITERATIONS,
+        min_movement_distance=MIN_MOVEMENT_DISTANCE,
+        on_iteration=None,
+    ):
+        pixel_to_count = OrderedDict()
+        for input_pixel in input_pixels:
+            pixel_to_count[input_pixel] = pixel_to_count.get(input_pixel, 0) + 1
+        return QuantizerWsMeansNumpy.quantize_histogram(
+            pixel_to_count,
+            starting_clusters,
+            max_colors,
+            max_iterations,
+            min_movement_distance,
+            on_iteration,
+        )
+
+    # /**
+    #  * Same as QuantizerWsMeans.quantize_histogram.
+    #  */
+    @staticmethod
+    def quantize_histogram(
+        pixel_to_count,
+        starting_clusters,
+        max_colors,
+        max_iterations=MAX_ITERATIONS,
+        min_movement_distance=MIN_MOVEMENT_DISTANCE,
+        on_iteration=None,
+    ):
+        return QuantizerWsMeansNumpy.quantize_counts(
+            pixel_to_count.keys(),
+            pixel_to_count.values(),
+            starting_clusters,
+            max_colors,
+            max_iterations,
+            min_movement_distance,
+            on_iteration,
+        )
+
+    # /**
+    #  * Same as QuantizerWsMeans.quantize_counts.
+    #  */
+    @staticmethod
+    def quantize_counts(
+        colors,
+        counts,
+        starting_clusters,
+        max_colors,
+        max_iterations=MAX_ITERATIONS,
+        min_movement_distance=MIN_MOVEMENT_DISTANCE,
+        on_iteration=None,
+    ):
+        check_iteration_options(max_iterations, min_movement_distance)
+        points, counts, clusters, cluster_indices = QuantizerWsMeans.initial_state(
+            colors, counts, starting_clusters, max_colors
+        )
+        cluster_count = len(clusters)
+        if cluster_count == 0:
+            return OrderedDict()
+        points = np.ascontiguousarray(np.array(points, dtype=np.float64).T)
+        counts = np.array(counts, dtype=np.int64)
+        clusters = np.array(clusters, dtype=np.float64).T
+        cluster_indices = np.array(cluster_indices, dtype=np.intp)
+        weights = counts.astype(np.float64)
+        pixel_count_sums = np.zeros(cluster_count, dtype=np.int64)
+        for iteration in range(max_iterations):
+            start_time = time.perf_counter()
+            cluster_distances = squared_distances(clusters, clusters)
+            # The current cluster is not in its own neighbour list. Keeping it
+            # as a candidate with a negative distance makes argmin fall back to
+            # it, and it wins any tie, which never counts as a move.
+            np.fill_diagonal(cluster_distances, -1.0)
+            points_moved = 0
+            cost = 0.0
+            for start in range(0, len(counts), BLOCK_SIZE):
+                end = min(start + BLOCK_SIZE, len(counts))
+                block_indices = cluster_indices[start:end]
+                distances = squared_distances(points[:, start:end], clusters)
+                rows = np.arange(end - start)
+                previous_distance = distances[rows, block_indices]
+                candidates = (
+                    cluster_distances[block_indices] < 4 * previous_distance[:, None]
+                )
+                distances = np.where(candidates, distances, np.inf)
+                new_cluster_index = np.argmin(distances, axis=1)
+                minimum_distance = distances[rows, new_cluster_index]
+                # argmin breaks ties by index, QuantizerWsMeans by neighbour
+                # order: distance from the current cluster, then index.
+                ties = distances == minimum_distance[:, None]
+                tied_rows = np.count_nonzero(ties, axis=1) > 1
+                if tied_rows.any():
+                    neighbor_order = np.where(
+                        ties[tied_rows],
+                        cluster_distances[block_indices[tied_rows]],
+                        np.inf,
+                    )
+                    new_cluster_index[tied_rows] = np.argmin(neighbor_order, axis=1)
+                moved = minimum_distance < previous_distance
+                distance_change = np.abs(
+                    np.sqrt(minimum_distance) - np.sqrt(previous_distance)
+                )
+                moved &= distance_change > min_movement_distance
+                block_indices[moved] = new_cluster_index[moved]
+                points_moved += int(np.count_nonzero(moved))
+                if on_iteration is not None:
+                    assigned_distance = np.where(
+                        moved, minimum_distance, previous_distance
+                    )
+                    cost += float(assigned_distance @ weights[start:end])
+            if points_moved == 0 and iteration != 0:
+                if on_iteration is not None:
+                    on_iteration(
+                        IterationStats(
+                            iteration, 0, cost, 0.0, time.perf_counter() - start_time
+                        )
+                    )
+                break
+            pixel_count_sums = np.bincount(
+                cluster_indices, weights=counts, minlength=cluster_count
+            ).astype(np.int64)
+            sums = np.stack(
+                [
+                    np.bincount(
+                        cluster_indices,
+                        weights=points[axis] * weights,
+                        minlength=cluster_count,
+                    )
+                    for axis in range(3)
+                ]
+            )
+            occupied = pixel_count_sums != 0
+            previous_clusters = clusters
+            clusters = np.zeros((3, cluster_count))
+            clusters[:, occupied] = sums[:, occupied] / pixel_count_sums[occupied]
+            if on_iteration is not None:
+                shift = previous_clusters - clusters
+                centroid_shift = float(np.sqrt(np.max(np.sum(shift * shift, axis=0))))
+                on_iteration(
+                    IterationStats(
+                        iteration,
+                        points_moved,
+                        cost,
+                        centroid_shift,
+                        time.perf_counter() - start_time,
+                    )
+                )
+        return QuantizerWsMeans.population_by_color(
+            clusters.T.tolist(), pixel_count_sums.tolist()
+        )
@@ -1,3 +1,5 @@
+import heapq
+
 from material_color_utilities_python.quantize.quantizer_map import QuantizerMap
 from material_color_utilities_python.utils.color_utils import (
     blue_from_argb,
@@ -5,9 +7,8 @@ from material_color_utilities_python.utils.color_utils import (
     red_from_argb,
 )
 
+# Default histogram resolution; each QuantizerWu can use its own.
 INDEX_BITS = 5
-SIDE_LENGTH = 33 # ((1 << INDEX_INDEX_BITS) + 1)
-TOTAL_SIZE = 35937 # SIDE_LENGTH * SIDE_LENGTH * SIDE_LENGTH
 directions = {
     "RED" : 'red',
     "GREEN" : 'green',
@@ -21,9 +22,18 @@ directions = {
 #  *
 #  * The algorithm was described by Xiaolin Wu in Graphic Gems II, published in
 #  * 1991.
+#  *
+#  * @param index_bits Bits of each channel used to place colors in the
+#  *     histogram, from 1 to 8. Fewer bits make a coarser, faster histogram;
+#  *     more bits separate similar colors better.
 #  */
 class QuantizerWu:
-    def __init__(self, weights = [], moments_r = [], moments_g = [], moments_b = [], moments = [], cubes = []):
+    def __init__(self, weights = [], moments_r = [], moments_g = [], moments_b = [], moments = [], cubes = [], index_bits = INDEX_BITS):
+        if not 1 <= index_bits <= 8:
+            raise ValueError("index_bits must be between 1 and 8")
+        self.index_bits = index_bits
+        self.side_length = (1 << index_bits) + 1
+        self.total_size = self.side_length * self.side_length * self.side_length
         self.weights = weights
         self.moments_r = moments_r
         self.moments_g = moments_g
@@ -38,25 +48,47 @@ class QuantizerWu:
     #  * @return Colors in ARGB format.
     #  */
     def quantize(self, pixels, max_colors):
-        self.construct_histogram(pixels)
+        return self.quantize_histogram(QuantizerMap.quantize(pixels), max_colors)
+
+    # /**
+    #  * @param countByColor Map with keys of opaque colors in ARGB format, and
+    #  *     values of the number of pixels of that color.
+    #  * @param maxColors The number of colors to divide the image into. A lower
+    #  *     number of colors may be returned.
+    #  * @return Colors in ARGB format.
+    #  */
+    def quantize_histogram(self, count_by_color, max_colors):
+        return self.quantize_counts(count_by_color.keys(), count_by_color.values(), max_colors)
+
+    # /**
+    #  * @param colors Opaque colors in ARGB format.
+    #  * @param counts The number of pixels of each color, parallel to colors.
+    #  * @param maxColors The number of colors to divide the image into. A lower
+    #  *     number of colors may be returned.
+    #  * @return Colors in ARGB format.
+    #  */
+    def quantize_counts(self, colors, counts, max_colors):
+        self.construct_histogram_from_counts(colors, counts)
         self.compute_moments()
         create_boxes_result = self.create_boxes(max_colors)
         results = self.create_result(create_boxes_result.result_count)
         return results
 
     def construct_histogram(self, pixels):
-        _a = None
-        self.weights = [0] * TOTAL_SIZE
-        self.moments_r = [0] * TOTAL_SIZE
-        self.moments_g = [0] * TOTAL_SIZE
-        self.moments_b = [0] * TOTAL_SIZE
-        self.moments = [0] * TOTAL_SIZE
         count_by_color = QuantizerMap.quantize(pixels)
-        for (pixel, count) in count_by_color.items():
+        self.construct_histogram_from_counts(count_by_color.keys(), count_by_color.values())
+
+    def construct_histogram_from_counts(self, colors, counts):
+        self.weights = [0] * self.total_size
+        self.moments_r = [0] * self.total_size
+        self.moments_g = [0] * self.total_size
+        self.moments_b = [0] * self.total_size
+        self.moments = [0] * self.total_size
+        for (pixel, count) in zip(colors, counts):
             red = red_from_argb(pixel)
             green = green_from_argb(pixel)
             blue = blue_from_argb(pixel)
-            bits_to_remove = 8 - INDEX_BITS
+            bits_to_remove = 8 - self.index_bits
             i_r = (red >> bits_to_remove) + 1
             i_g = (green >> bits_to_remove) + 1
             i_b = (blue >> bits_to_remove) + 1
@@ -68,19 +100,19 @@ class QuantizerWu:
             self.moments[index] += count * (red * red + green * green + blue * blue)
 
     def compute_moments(self):
-        for r in range(1, SIDE_LENGTH):
-            area = [0] * SIDE_LENGTH
-            area_r = [0] * SIDE_LENGTH
-            area_g = [0] * SIDE_LENGTH
-            area_b = [0] * SIDE_LENGTH
-            area2 = [0.0] * SIDE_LENGTH
-            for g in range(1, SIDE_LENGTH):
+        for r in range(1, self.side_length):
+            area = [0] * self.side_length
+            area_r = [0] * self.side_length
+            area_g = [0] * self.side_length
+            area_b = [0] * self.side_length
+            area2 = [0.0] * self.side_length
+            for g in range(1, self.side_length):
                 line = 0
                 line_r = 0
                 line_g = 0
                 line_b = 0
                 line2 = 0.0
-                for b in range(1, SIDE_LENGTH):
+                for b in range(1, self.side_length):
                     index = self.get_index(r, g, b)
                     line += self.weights[index]
                     line_r += self.moments_r[index]
@@ -99,33 +131,48 @@ class QuantizerWu:
                     self.moments_b[index] = self.moments_b[previous_index] + area_b[b]
                     self.moments[index] = self.moments[previous_index] + area2[b]
 
+    # /**
+    #  * Repeatedly cuts the box with the largest variance in two, until there
+    #  * are max_colors boxes or no box can be cut further.
+    #  *
+    #  * Candidate boxes are kept in a heap ordered by decreasing variance and
+    #  * then increasing index, which is the order the linear scan of the
+    #  * reference implementation picks them in. Entries whose variance no
+    #  * longer matches volume_variance are stale and skipped. As in the
+    #  * reference, the box created by the latest cut is a candidate for the
+    #  * next one, and a failed cut retries the same slot.
+    #  */
     def create_boxes(self, max_colors):
         self.cubes = [Box() for _ in [0] * max_colors]
         volume_variance = [0.0] * max_colors
         self.cubes[0].r0 = 0
         self.cubes[0].g0 = 0
         self.cubes[0].b0 = 0
-        self.cubes[0].r1 = SIDE_LENGTH - 1
-        self.cubes[0].g1 = SIDE_LENGTH - 1
-        self.cubes[0].b1 = SIDE_LENGTH - 1
+        self.cubes[0].r1 = self.side_length - 1
+        self.cubes[0].g1 = self.side_length - 1
+        self.cubes[0].b1 = self.side_length - 1
+        candidates = []
         generated_color_count = max_colors
         next_index = 0
-        for i in range(1, max_colors):
+        i = 1
+        while i < max_colors:
             if self.cut(self.cubes[next_index], self.cubes[i]):
-                volume_variance[next_index] = self.variance(self.cubes[next_index]) if self.cubes[next_index].vol > 1 else 0.0
-                volume_variance[i] = self.variance(self.cubes[i]) if self.cubes[i].vol > 1 else 0.0
+                for index in (next_index, i):
+                    cube = self.cubes[index]
+                    volume_variance[index] = self.variance(cube) if cube.vol > 1 else 0.0
+                    if volume_variance[index] > 0.0:
+                        heapq.heappush(candidates, (-volume_variance[index], index))
+                color_count = i + 1
+                i += 1
             else:
                 volume_variance[next_index] = 0.0
-                i -= 1
-            next_index = 0
-            temp = volume_variance[0]
-            for j in range(1, i):
-                if volume_variance[j] > temp:
-                    temp = volume_variance[j]
-                    next_index = j
-            if temp <= 0.0:
-                generated_color_count = i + 1
+                color_count = i
+            while candidates and -candidates[0][0] != volume_variance[candidates[0][1]]:
+                heapq.heappop(candidates)
+            if not candidates:
+                generated_color_count = color_count
                 break
+            next_index = candidates[0][1]
         return CreateBoxesResult(max_colors, generated_color_count)
 
     def create_result(self, color_count):
@@ -250,7 +297,8 @@ class QuantizerWu:
             raise Exception('unexpected direction ' + direction)
 
     def get_index(self, r, g, b):
-        return (r << (INDEX_BITS * 2)) + (r << (INDEX_BITS + 1)) + r + (g << INDEX_BITS) + g + b
+        index_bits = self.index_bits
+        return (r << (index_bits * 2)) + (r << (index_bits + 1)) + r + (g << index_bits) + g + b
 
 # /**
 #  * Keeps track of the state of each box created as the Wu  quantization
@@ -0,0 +1,158 @@
+# /**
+#  * QuantizerWu with its histogram and moments held in NumPy arrays.
+#  *
+#  * Produces the same colors as QuantizerWu: weights and per-channel moments
+#  * are int64, and the squared moments are float64, which hold them exactly up
+#  * to about 4.6e10 pixels (2^53 / (3 * 255^2)). NumPy is an optional
+#  * dependency; install the "numpy" extra to use this module.
+#  */
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "quantizer_wu_numpy requires NumPy; "
+        "install material-color-utilities-python[numpy]"
+    ) from e
+
+from material_color_utilities_python.quantize.quantizer_wu import (
+    MaximizeResult,
+    QuantizerWu,
+    directions,
+)
+
+
+class QuantizerWuNumpy(QuantizerWu):
+    # /**
+    #  * Bins all colors at once with bincount instead of one at a time.
+    #  */
+    def construct_histogram_from_counts(self, colors, counts):
+        colors = np.fromiter(colors, dtype=np.int64)
+        counts = np.fromiter(counts, dtype=np.int64, count=len(colors))
+        red = colors >> 16 & 255
+        green = colors >> 8 & 255
+        blue = colors & 255
+        bits_to_remove = 8 - self.index_bits
+        side_length = self.side_length
+        index = (
+            ((red >> bits_to_remove) + 1) * (side_length * side_length)
+            + ((green >> bits_to_remove) + 1) * side_length
+            + (blue >> bits_to_remove)
+            + 1
+        )
+
+        def histogram(values):
+            return np.bincount(index, weights=values, minlength=self.total_size)
+
+        self.weights = histogram(counts).astype(np.int64)
+        self.moments_r = histogram(counts * red).astype(np.int64)
+        self.moments_g = histogram(counts * green).astype(np.int64)
+        self.moments_b = histogram(counts * blue).astype(np.int64)
+        self.moments = histogram(counts * (red * red + green * green + blue * blue))
+
+    # /**
+    #  * Turns the histogram into cumulative moments with a prefix sum along
+    #  * each axis of the cube. Plane 0 of each axis stays empty, as in
+    #  * QuantizerWu.compute_moments.
+    #  */
+    def compute_moments(self):
+        shape = (self.side_length,) * 3
+        for name in ("weights", "moments_r", "moments_g", "moments_b", "moments"):
+            cube = getattr(self, name).reshape(shape)
+            for axis in range(3):
+                np.cumsum(cube, axis=axis, out=cube)
+
+    # /**
+    #  * QuantizerWu.volume as a Python number, so variance and the cut sums
+    #  * built from it can't overflow int64.
+    #  */
+    def volume(self, cube, moment):
+        return super().volume(cube, moment).item()
+
+    # /**
+    #  * Evaluates every cut position along direction at once. Equivalent to
+    #  * QuantizerWu.maximize: the first position with the largest positive
+    #  * sum of the two halves' variance terms wins.
+    #  */
+    def maximize(
+        self, cube, direction, first, last, whole_r, whole_g, whole_b, whole_w
+    ):
+        if first >= last:
+            return MaximizeResult(-1, 0.0)
+        half_r = self.bottom(cube, direction, self.moments_r) + self.tops(
+            cube, direction, first, last, self.moments_r
+        )
+        half_g = self.bottom(cube, direction, self.moments_g) + self.tops(
+            cube, direction, first, last, self.moments_g
+        )
+        half_b = self.bottom(cube, direction, self.moments_b) + self.tops(
+            cube, direction, first, last, self.moments_b
+        )
+        half_w = self.bottom(cube, direction, self.weights) + self.tops(
+            cube, direction, first, last, self.weights
+        )
+        other_w = whole_w - half_w
+        valid = (half_w != 0) & (other_w != 0)
+        # Every half is at most the whole, as all moments are non-negative.
+        exact = max(whole_r, whole_g, whole_b) < MAX_EXACT_MOMENT
+        with np.errstate(divide="ignore", invalid="ignore"):
+            temp = sum_of_squares(half_r, half_g, half_b, exact) / half_w
+            temp += (
+                sum_of_squares(
+                    whole_r - half_r, whole_g - half_g, whole_b - half_b, exact
+                )
+                / other_w
+            )
+        temp = np.where(valid, temp, 0.0)
+        best = int(np.argmax(temp))
+        if temp[best] <= 0.0:
+            return MaximizeResult(-1, 0.0)
+        return MaximizeResult(first + best, float(temp[best]))
+
+    # /**
+    #  * QuantizerWu.top for every position in first..last - 1.
+    #  */
+    def tops(self, cube, direction, first, last, moment):
+        moment = moment.reshape((self.side_length,) * 3)
+        if direction == directions["RED"]:
+            s = moment[first:last]
+            return (
+                s[:, cube.g1, cube.b1]
+                - s[:, cube.g1, cube.b0]
+                - s[:, cube.g0, cube.b1]
+                + s[:, cube.g0, cube.b0]
+            )
+        elif direction == directions["GREEN"]:
+            s = moment[:, first:last]
+            return (
+                s[cube.r1, :, cube.b1]
+                - s[cube.r1, :, cube.b0]
+                - s[cube.r0, :, cube.b1]
+                + s[cube.r0, :, cube.b0]
+            )
+        elif direction == directions["BLUE"]:
+            s = moment[:, :, first:last]
+            return (
+                s[cube.r1, cube.g1, :]
+                - s[cube.r1, cube.g0, :]
+                - s[cube.r0, cube.g1, :]
+                + s[cube.r0, cube.g0, :]
+            )
+        else:
+            raise ValueError(f"unexpected direction {direction}")
+
+
+# Largest channel moment whose sum of three squares fits in an int64.
+MAX_EXACT_MOMENT = 1_700_000_000
+
+
+# /**
+#  * r * r + g * g + b * b as float64. When exact is True the sum is taken in
+#  * int64 and rounded once, like the Python int arithmetic of QuantizerWu.
+#  */
+def sum_of_squares(r, g, b, exact):
+    if exact:
+        return (r * r + g * g + b * b).astype(np.float64)
+    r = r.astype(np.float64)
+    g = g.astype(np.float64)
+    b = b.astype(np.float64)
+    return r * r + g * g + b * b
@@ -8,6 +8,17 @@ from material_color_utilities_python.utils.math_utils import (
 )
 
 
+# /**
+#  * The hue and chroma of a color, the only CAM16 dimensions Score reads.
+#  */
+class HueChroma:
+    __slots__ = ("chroma", "hue")
+
+    def __init__(self, hue, chroma):
+        self.hue = hue
+        self.chroma = chroma
+
+
 # /**
 #  *  Given a large set of colors, remove colors that are unsuitable for a UI
 #  *  theme, and rank the rest based on suitability.
@@ -43,14 +54,16 @@ class Score:
         # // count. Also, fill a cache with CAM16 colors representing each color, and
         # // record the proportion of colors for each CAM16 hue.
         colors_to_proportion = OrderedDict()
+        # // Only hue and chroma are read, so the cache holds HueChroma objects
+        # // instead of full CAM16 colors.
         colors_to_cam = OrderedDict()
         hue_proportions = [0] * 361
         for color, population in colors_to_population.items():
             proportion = population / population_sum
             colors_to_proportion[color] = proportion
-            cam = Cam16.from_int(color)
-            colors_to_cam[color] = cam
-            hue = round(cam.hue)
+            cam_hue, cam_chroma, _ = Cam16.hue_chroma_j_from_int(color)
+            colors_to_cam[color] = HueChroma(cam_hue, cam_chroma)
+            hue = round(cam_hue)
             hue_proportions[hue] += proportion
         # // Determine the proportion of the colors around each color, by summing the
         # // proportions around each color's hue.
@@ -65,14 +78,15 @@ class Score:
         # // Score the colors by their proportion, as well as how chromatic they are.
         colors_to_score = OrderedDict()
         for color, cam in colors_to_cam.items():
+            cam_chroma = cam.chroma
             proportion = colors_to_excited_proportion[color]
             proportion_score = proportion * 100.0 * Score.WEIGHT_PROPORTION
             chroma_weight = (
                 Score.WEIGHT_CHROMA_BELOW
-                if cam.chroma < Score.TARGET_CHROMA
+                if cam_chroma < Score.TARGET_CHROMA
                 else Score.WEIGHT_CHROMA_ABOVE
             )
-            chroma_score = (cam.chroma - Score.TARGET_CHROMA) * chroma_weight
+            chroma_score = (cam_chroma - Score.TARGET_CHROMA) * chroma_weight
             score = proportion_score + chroma_score
             colors_to_score[color] = score
         # // Remove colors that are unsuitable, ex. very dark or unchromatic colors.
@@ -100,6 +114,10 @@ class Score:
             answer.append(0xFF4285F4)  # // Google Blue
         return answer
 
+    # /**
+    #  * @param colors_to_cam Map with keys of colors and values with a chroma
+    #  *     attribute, such as Cam16 or HueChroma objects.
+    #  */
     @staticmethod
     def filter(colors_to_excited_proportion, colors_to_cam):
         filtered = []
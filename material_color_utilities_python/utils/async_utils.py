@@ -0,0 +1,154 @@
+# /**
+#  * asyncio variants of the theming functions.
+#  *
+#  * The CPU work runs on one executor shared by every call, a process pool by
+#  * default, so the event loop stays responsive. configure_executor replaces
+#  * the pool or limits how many calls run at once. Cancelling a call that is
+#  * still waiting for a slot or a worker removes it from the queue; a call a
+#  * worker has already started runs to completion and its result is dropped.
+#  *
+#  * Only functions that take milliseconds have variants here; conversions such
+#  * as hex_from_argb are cheap enough to call directly.
+#  */
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+from material_color_utilities_python.utils.batch_utils import prepare_item
+from material_color_utilities_python.utils.image_utils import (
+    DEFAULT_MAX_PIXELS,
+    DEFAULT_RESAMPLE,
+    source_color_from_image,
+)
+from material_color_utilities_python.utils.theme_utils import (
+    custom_color,
+    theme_from_image,
+    theme_from_source_color,
+)
+
+executor = None
+owns_executor = False
+max_concurrency = None
+semaphores = weakref.WeakKeyDictionary()
+lock = threading.Lock()
+
+
+# /**
+#  * Sets the executor and concurrency limit used by the async functions.
+#  *
+#  * @param new_executor A concurrent.futures executor to use, or None for a
+#  *     process pool created on first use with max_workers workers. An
+#  *     executor passed in is not shut down by shutdown_executor.
+#  * @param max_workers Size of the default process pool; None uses the CPU
+#  *     count.
+#  * @param concurrency Largest number of calls running on the executor at
+#  *     once, or None for no limit beyond the executor's own.
+#  */
+def configure_executor(new_executor=None, max_workers=None, concurrency=None):
+    global executor, owns_executor, max_concurrency
+    if concurrency is not None and concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    shutdown_executor(wait=False)
+    with lock:
+        if new_executor is None:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            owns_executor = True
+        else:
+            executor = new_executor
+            owns_executor = False
+        max_concurrency = concurrency
+        semaphores.clear()
+
+
+# /**
+#  * @return The shared executor, creating the default process pool if none is
+#  *     configured.
+#  */
+def get_executor():
+    global executor, owns_executor
+    with lock:
+        if executor is None:
+            executor = ProcessPoolExecutor()
+            owns_executor = True
+        return executor
+
+
+# /**
+#  * Shuts down the default process pool and forgets the configured executor.
+#  * The next call creates a new pool.
+#  */
+def shutdown_executor(wait=True):
+    global executor, owns_executor
+    with lock:
+        old_executor, old_owned = executor, owns_executor
+        executor = None
+        owns_executor = False
+    if old_executor is not None and old_owned:
+        old_executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def get_semaphore():
+    # asyncio primitives belong to one event loop, so each loop gets its own.
+    if max_concurrency is None:
+        return None
+    loop = asyncio.get_running_loop()
+    with lock:
+        semaphore = semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            semaphores[loop] = semaphore
+        return semaphore
+
+
+# /**
+#  * Runs function(*args, **kwargs) on the shared executor.
+#  */
+async def run_in_executor(function, *args, **kwargs):
+    semaphore = get_semaphore()
+    call = functools.partial(function, *args, **kwargs)
+    if semaphore is None:
+        return await asyncio.get_running_loop().run_in_executor(get_executor(), call)
+    async with semaphore:
+        return await asyncio.get_running_loop().run_in_executor(get_executor(), call)
+
+
+# /**
+#  * Async source_color_from_image. PIL images and binary file objects are
+#  * decoded and downsampled on a thread first, so only the thumbnail is sent
+#  * to the executor.
+#  */
+async def source_color_from_image_async(
+    image, max_pixels=DEFAULT_MAX_PIXELS, resample=DEFAULT_RESAMPLE
+):
+    image = await asyncio.to_thread(prepare_item, image, max_pixels, resample)
+    return await run_in_executor(source_color_from_image, image, max_pixels, resample)
+
+
+# /**
+#  * Async theme_from_image. PIL images and binary file objects are decoded and
+#  * downsampled on a thread first, so only the thumbnail is sent to the
+#  * executor.
+#  */
+async def theme_from_image_async(
+    image, custom_colors=(), max_pixels=DEFAULT_MAX_PIXELS, resample=DEFAULT_RESAMPLE
+):
+    image = await asyncio.to_thread(prepare_item, image, max_pixels, resample)
+    return await run_in_executor(
+        theme_from_image, image, custom_colors, max_pixels, resample
+    )
+
+
+# /**
+#  * Async theme_from_source_color.
+#  */
+async def theme_from_source_color_async(source, custom_colors=()):
+    return await run_in_executor(theme_from_source_color, source, custom_colors)
+
+
+# /**
+#  * Async custom_color.
+#  */
+async def custom_color_async(source, color):
+    return await run_in_executor(custom_color, source, color)
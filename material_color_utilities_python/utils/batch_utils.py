@@ -0,0 +1,219 @@
+# /**
+#  * Source colors and themes for many images at once, computed on a process
+#  * pool.
+#  *
+#  * Items are sent to the workers in chunks. Paths and file names are sent as
+#  * they are and opened by the worker; PIL images and binary file objects are
+#  * decoded and downsampled in this process first, so only the pixels the
+#  * quantizer uses are pickled.
+#  *
+#  * Results are yielded as BatchResult objects, either in input order or as
+#  * soon as they complete. An image that fails doesn't stop the batch; its
+#  * result carries the exception instead.
+#  */
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from PIL import Image
+
+from material_color_utilities_python.utils.image_utils import (
+    DEFAULT_MAX_PIXELS,
+    DEFAULT_RESAMPLE,
+    downsample_image,
+    open_image,
+    source_color_from_image,
+)
+from material_color_utilities_python.utils.theme_utils import theme_from_image
+
+DEFAULT_CHUNK_SIZE = 4
+
+# Number of chunks kept queued per worker, so long inputs are read lazily.
+CHUNKS_PER_WORKER = 2
+
+
+# /**
+#  * The outcome for one item of a batch.
+#  *
+#  * @param index Position of the item in the input.
+#  * @param value The source color or theme, or None if the item failed.
+#  * @param error The exception raised for the item, or None if it succeeded.
+#  */
+class BatchResult:
+    def __init__(self, index, value=None, error=None):
+        self.index = index
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"BatchResult(index={self.index}, error={self.error!r})"
+        return f"BatchResult(index={self.index}, value={self.value!r})"
+
+
+# Stands in for an item that failed before it could be sent to a worker.
+class PreparationError:
+    def __init__(self, error):
+        self.error = error
+
+
+# /**
+#  * Makes an image ready to be sent to a worker process. Paths are returned
+#  * as they are, for the worker to open. PIL images and binary file objects,
+#  * which can't be pickled, are decoded here and downsampled, so only the
+#  * small image is pickled.
+#  */
+def prepare_item(item, max_pixels, resample):
+    if isinstance(item, (str, os.PathLike)):
+        return item
+    if isinstance(item, Image.Image):
+        return downsample_image(item, max_pixels, resample).copy()
+    with open_image(item, max_pixels) as opened:
+        return downsample_image(opened, max_pixels, resample).copy()
+
+
+def chunks(items, chunk_size, max_pixels, resample):
+    chunk = []
+    start = 0
+    for index, item in enumerate(items):
+        try:
+            chunk.append(prepare_item(item, max_pixels, resample))
+        # Any error is reported on the item's result, not raised for the batch.
+        except Exception as e:  # noqa: BLE001
+            chunk.append(PreparationError(e))
+        if len(chunk) == chunk_size:
+            yield start, chunk
+            start = index + 1
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+# Runs in the worker process.
+def run_chunk(function, start, items, kwargs):
+    results = []
+    for index, item in enumerate(items, start):
+        if isinstance(item, PreparationError):
+            results.append(BatchResult(index, error=item.error))
+            continue
+        try:
+            results.append(BatchResult(index, function(item, **kwargs)))
+        except Exception as e:  # noqa: BLE001
+            results.append(BatchResult(index, error=e))
+    return results
+
+
+def take_results(pending, chunk_items, ordered):
+    if ordered:
+        done = [pending.popleft()]
+    else:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+    for future in done:
+        start, length = chunk_items.pop(future)
+        error = future.exception()
+        if error is None:
+            yield from future.result()
+        else:
+            # The chunk itself failed, e.g. its results couldn't be pickled or
+            # the worker died; every item in it gets the error.
+            for index in range(start, start + length):
+                yield BatchResult(index, error=error)
+
+
+def iterate_batch(function, images, kwargs, workers, chunk_size, ordered, executor):
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    max_pending = CHUNKS_PER_WORKER * (workers or os.cpu_count() or 1)
+    pending = deque()
+    chunk_items = {}
+    try:
+        for start, chunk in chunks(
+            images, chunk_size, kwargs["max_pixels"], kwargs["resample"]
+        ):
+            future = executor.submit(run_chunk, function, start, chunk, kwargs)
+            pending.append(future)
+            chunk_items[future] = (start, len(chunk))
+            if len(pending) >= max_pending:
+                yield from take_results(pending, chunk_items, ordered)
+        while pending:
+            yield from take_results(pending, chunk_items, ordered)
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run_batch(function, images, kwargs, workers, chunk_size, ordered, executor):
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    return iterate_batch(
+        function, images, kwargs, workers, chunk_size, ordered, executor
+    )
+
+
+# /**
+#  * Computes the source color of each image on a process pool.
+#  *
+#  * @param images Iterable of paths, binary file objects or PIL images. It is
+#  *     consumed lazily.
+#  * @param workers Number of worker processes; None uses the CPU count.
+#  * @param chunk_size Number of images sent to a worker at a time.
+#  * @param ordered Yield results in input order if True, as they complete
+#  *     otherwise.
+#  * @param executor An existing concurrent.futures executor to run on instead
+#  *     of a new process pool. It is not shut down afterwards.
+#  * @return Iterator of BatchResult whose values are ARGB source colors.
+#  */
+def source_colors_from_images(
+    images,
+    workers=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    ordered=True,
+    max_pixels=DEFAULT_MAX_PIXELS,
+    resample=DEFAULT_RESAMPLE,
+    executor=None,
+):
+    kwargs = {"max_pixels": max_pixels, "resample": resample}
+    return run_batch(
+        source_color_from_image, images, kwargs, workers, chunk_size, ordered, executor
+    )
+
+
+# /**
+#  * Computes a theme from each image on a process pool.
+#  *
+#  * @param images Iterable of paths, binary file objects or PIL images. It is
+#  *     consumed lazily.
+#  * @param custom_colors Array of custom colors, applied to every theme.
+#  * @return Iterator of BatchResult whose values are Theme objects.
+#  *
+#  * The other parameters are as in source_colors_from_images.
+#  */
+def themes_from_images(
+    images,
+    custom_colors=(),
+    workers=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    ordered=True,
+    max_pixels=DEFAULT_MAX_PIXELS,
+    resample=DEFAULT_RESAMPLE,
+    executor=None,
+):
+    kwargs = {
+        "custom_colors": custom_colors,
+        "max_pixels": max_pixels,
+        "resample": resample,
+    }
+    return run_batch(
+        theme_from_image, images, kwargs, workers, chunk_size, ordered, executor
+    )
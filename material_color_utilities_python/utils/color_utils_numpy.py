@@ -0,0 +1,242 @@
+# /**
+#  * Color science utilities on NumPy arrays.
+#  *
+#  * Vectorized counterparts of the functions in color_utils.py. Each function
+#  * takes arrays (or anything np.asarray accepts) in place of scalars and
+#  * follows the scalar formula step by step, so results match color_utils up
+#  * to floating point rounding. Functions that return several components, such
+#  * as lab_from_argb, stack them along the first axis, so
+#  * `l, a, b = lab_from_argb(pixels)` works as it does for a single color.
+#  *
+#  * NumPy is an optional dependency; install the "numpy" extra to use this
+#  * module.
+#  */
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "color_utils_numpy requires NumPy; "
+        "install material-color-utilities-python[numpy]"
+    ) from e
+
+from material_color_utilities_python.utils.color_utils import (
+    LINEARIZED_TABLE,
+    SRGB_TO_XYZ,
+    WHITE_POINT_D65,
+    XYZ_TO_SRGB,
+)
+
+LINEARIZED = np.array(LINEARIZED_TABLE, dtype=np.float64)
+
+
+def _as_argb(argb):
+    return np.asarray(argb).astype(np.uint32)
+
+
+# /**
+#  * Multiplies a (3, ...) stack of rows by a 3x3 matrix, like
+#  * math_utils.matrix_multiply does for a single row.
+#  */
+def matrix_multiply(row, matrix):
+    return np.stack(
+        [
+            row[0] * matrix[i][0] + row[1] * matrix[i][1] + row[2] * matrix[i][2]
+            for i in range(3)
+        ]
+    )
+
+
+# /**
+#  * Converts colors from RGB components to ARGB format.
+#  */
+def argb_from_rgb(red, green, blue):
+    red = np.asarray(red).astype(np.uint32) & 255
+    green = np.asarray(green).astype(np.uint32) & 255
+    blue = np.asarray(blue).astype(np.uint32) & 255
+    return np.uint32(0xFF000000) | (red << 16) | (green << 8) | blue
+
+
+# /**
+#  * Returns the alpha component of colors in ARGB format.
+#  */
+def alpha_from_argb(argb):
+    return _as_argb(argb) >> 24 & 255
+
+
+# /**
+#  * Returns the red component of colors in ARGB format.
+#  */
+def red_from_argb(argb):
+    return _as_argb(argb) >> 16 & 255
+
+
+# /**
+#  * Returns the green component of colors in ARGB format.
+#  */
+def green_from_argb(argb):
+    return _as_argb(argb) >> 8 & 255
+
+
+# /**
+#  * Returns the blue component of colors in ARGB format.
+#  */
+def blue_from_argb(argb):
+    return _as_argb(argb) & 255
+
+
+# /**
+#  * Returns whether colors in ARGB format are opaque.
+#  */
+def is_opaque(argb):
+    return alpha_from_argb(argb) >= 255
+
+
+# /**
+#  * Converts colors from a (3, ...) stack of linear RGB components to ARGB
+#  * format.
+#  */
+def argb_from_linrgb(linrgb):
+    return argb_from_rgb(
+        delinearized(linrgb[0]), delinearized(linrgb[1]), delinearized(linrgb[2])
+    )
+
+
+# /**
+#  * Converts colors from XYZ to ARGB.
+#  */
+def argb_from_xyz(x, y, z):
+    xyz = np.stack(np.broadcast_arrays(x, y, z)).astype(np.float64)
+    return argb_from_linrgb(matrix_multiply(xyz, XYZ_TO_SRGB))
+
+
+# /**
+#  * Converts colors from ARGB to XYZ.
+#  *
+#  * @return A (3, ...) array of the X, Y and Z of each color.
+#  */
+def xyz_from_argb(argb):
+    argb = _as_argb(argb)
+    linrgb = np.stack(
+        [
+            LINEARIZED[argb >> 16 & 255],
+            LINEARIZED[argb >> 8 & 255],
+            LINEARIZED[argb & 255],
+        ]
+    )
+    return matrix_multiply(linrgb, SRGB_TO_XYZ)
+
+
+def lab_inv_f(ft):
+    e = 216.0 / 24389.0
+    kappa = 24389.0 / 27.0
+    ft3 = ft * ft * ft
+    return np.where(ft3 > e, ft3, (116 * ft - 16) / kappa)
+
+
+# /**
+#  * Converts colors represented in Lab color space into ARGB integers.
+#  */
+def argb_from_lab(lightness, a, b):
+    white_point = WHITE_POINT_D65
+    fy = (np.asarray(lightness, dtype=np.float64) + 16.0) / 116.0
+    fx = np.asarray(a, dtype=np.float64) / 500.0 + fy
+    fz = fy - np.asarray(b, dtype=np.float64) / 200.0
+    x = lab_inv_f(fx) * white_point[0]
+    y = lab_inv_f(fy) * white_point[1]
+    z = lab_inv_f(fz) * white_point[2]
+    return argb_from_xyz(x, y, z)
+
+
+def lab_f(t):
+    e = 216.0 / 24389.0
+    kappa = 24389.0 / 27.0
+    return np.where(t > e, np.cbrt(t), (kappa * t + 16) / 116)
+
+
+# /**
+#  * Converts colors from ARGB representation to L*a*b* representation.
+#  *
+#  * @return A (3, ...) array of the L*, a* and b* of each color.
+#  */
+def lab_from_argb(argb):
+    x, y, z = xyz_from_argb(argb)
+    white_point = WHITE_POINT_D65
+    fx = lab_f(x / white_point[0])
+    fy = lab_f(y / white_point[1])
+    fz = lab_f(z / white_point[2])
+    return np.stack([116.0 * fy - 16, 500.0 * (fx - fy), 200.0 * (fy - fz)])
+
+
+# /**
+#  * Converts L* values to ARGB representations of grayscale colors with
+#  * lightness matching L*.
+#  */
+def argb_from_lstar(lstar):
+    lstar = np.asarray(lstar, dtype=np.float64)
+    fy = (lstar + 16.0) / 116.0
+    kappa = 24389.0 / 27.0
+    epsilon = 216.0 / 24389.0
+    cube = fy * fy * fy
+    y = np.where(lstar > 8.0, cube, lstar / kappa)
+    xz = np.where(cube > epsilon, cube, lstar / kappa)
+    white_point = WHITE_POINT_D65
+    return argb_from_xyz(xz * white_point[0], y * white_point[1], xz * white_point[2])
+
+
+# /**
+#  * Converts Y values, in XYZ scaled to 0..1, to L*.
+#  */
+def lstar_from_y(y):
+    e = 216.0 / 24389.0
+    return np.where(y <= e, 24389.0 / 27.0 * y, 116.0 * np.cbrt(y) - 16.0)
+
+
+# /**
+#  * Computes the L* values of colors in ARGB representation.
+#  */
+def lstar_from_argb(argb):
+    argb = _as_argb(argb)
+    matrix = SRGB_TO_XYZ
+    y = (
+        matrix[1][0] * LINEARIZED[argb >> 16 & 255]
+        + matrix[1][1] * LINEARIZED[argb >> 8 & 255]
+        + matrix[1][2] * LINEARIZED[argb & 255]
+    )
+    return lstar_from_y(y / 100.0)
+
+
+# /**
+#  * Converts L* values to Y values.
+#  */
+def y_from_lstar(lstar):
+    lstar = np.asarray(lstar, dtype=np.float64)
+    return np.where(
+        lstar > 8.0,
+        np.power((lstar + 16.0) / 116.0, 3.0) * 100.0,
+        lstar / (24389.0 / 27.0) * 100.0,
+    )
+
+
+# /**
+#  * Linearizes RGB components.
+#  */
+def linearized(rgb_component):
+    normalized = np.asarray(rgb_component, dtype=np.float64) / 255.0
+    return np.where(
+        normalized <= 0.040449936,
+        normalized / 12.92 * 100.0,
+        np.power((np.maximum(normalized, 0.040449936) + 0.055) / 1.055, 2.4) * 100.0,
+    )
+
+
+# /**
+#  * Delinearizes linear RGB components into uint32 channel values in 0..255.
+#  */
+def delinearized(rgb_component):
+    normalized = np.asarray(rgb_component, dtype=np.float64) / 100.0
+    delinearized_value = np.where(
+        normalized <= 0.0031308,
+        normalized * 12.92,
+        1.055 * np.power(np.maximum(normalized, 0.0031308), 1.0 / 2.4) - 0.055,
+    )
+    return np.clip(np.round(delinearized_value * 255.0), 0, 255).astype(np.uint32)
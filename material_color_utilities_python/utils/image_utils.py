@@ -5,36 +5,167 @@
 #  * @return Source color - the color most suitable for creating a UI theme
 #  */
 
+import math
+import sys
+from array import array
+from collections import Counter
+from itertools import compress
+
+from PIL import Image
+
 from material_color_utilities_python.quantize.quantizer_celebi import QuantizerCelebi
 from material_color_utilities_python.score.score import Score
-from material_color_utilities_python.utils.color_utils import argb_from_rgb
 
+# array typecode of an unsigned 32-bit integer on this platform.
+ARGB_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+# Images are downsampled to at most this many pixels before quantizing. This
+# is the extraction area Android uses for wallpaper colors.
+DEFAULT_MAX_PIXELS = 112 * 112
+DEFAULT_RESAMPLE = Image.Resampling.BILINEAR
+
+# Maps alpha to 1 for opaque pixels and 0 for the rest.
+OPAQUE_LUT = [0] * 255 + [1]
+
+# Number of rows get_argb_histogram converts at a time.
+DEFAULT_BAND_HEIGHT = 64
 
-def get_argb_pixels(image):
-    pixels = []
-    # Load the image as a 2D array of RGBA values
-    img_data = image.convert("RGBA").load()
-
-    # Loop through every pixel directly
-    for y in range(image.height):
-        for x in range(image.width):
-            r, g, b, a = img_data[x, y]  # Get the RGBA values directly
-            if a < 255:
-                continue
-            argb = argb_from_rgb(r, g, b)
-            pixels.append(argb)
 
+# /**
+#  * @return The (width, height) an image of the given size is scaled down to
+#  *     so it has at most max_pixels pixels, or None if it already fits.
+#  */
+def downsampled_size(width, height, max_pixels):
+    if max_pixels is None or width * height <= max_pixels:
+        return None
+    scale = math.sqrt(max_pixels / (width * height))
+    return (max(1, int(width * scale)), max(1, int(height * scale)))
+
+
+# /**
+#  * Scales an image down, keeping its aspect ratio, so it has at most
+#  * max_pixels pixels. Smaller images are returned unchanged.
+#  *
+#  * @param image A PIL image.
+#  * @param max_pixels Largest number of pixels to keep, or None to keep all.
+#  * @param resample Pillow resampling filter used to scale the image.
+#  * @return The scaled image.
+#  */
+def downsample_image(image, max_pixels=DEFAULT_MAX_PIXELS, resample=DEFAULT_RESAMPLE):
+    size = downsampled_size(image.width, image.height, max_pixels)
+    if size is None:
+        return image
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA")
+    return image.resize(size, resample)
+
+
+# /**
+#  * Opens an image file for color extraction. JPEGs are set up to decode at
+#  * the smallest power-of-two reduction (down to 1/8) that still has at least
+#  * the size downsample_image scales them to, so a large photo is never
+#  * decoded at full resolution.
+#  *
+#  * @param source A path or a binary file object.
+#  * @param max_pixels The pixel budget the image will be downsampled to.
+#  * @return An unloaded PIL image; close it when done.
+#  */
+def open_image(source, max_pixels=DEFAULT_MAX_PIXELS):
+    image = Image.open(source)
+    size = downsampled_size(image.width, image.height, max_pixels)
+    if size is not None:
+        image.draft(None, size)
+    return image
+
+
+# /**
+#  * Downsamples an image and calls extract with the result.
+#  *
+#  * @param image A PIL image, a path or a binary file object. Paths and file
+#  *     objects are opened with open_image and closed afterwards.
+#  * @param extract Function of a PIL image, such as get_argb_pixels.
+#  */
+def extract_downsampled(
+    image, extract, max_pixels=DEFAULT_MAX_PIXELS, resample=DEFAULT_RESAMPLE
+):
+    if isinstance(image, Image.Image):
+        return extract(downsample_image(image, max_pixels, resample))
+    with open_image(image, max_pixels) as opened:
+        return extract(downsample_image(opened, max_pixels, resample))
+
+
+# /**
+#  * Downsamples an image and extracts its opaque pixels.
+#  */
+def get_downsampled_argb_pixels(
+    image, max_pixels=DEFAULT_MAX_PIXELS, resample=DEFAULT_RESAMPLE
+):
+    return extract_downsampled(image, get_argb_pixels, max_pixels, resample)
+
+
+# /**
+#  * Extracts the opaque pixels of an image as colors in ARGB format.
+#  *
+#  * The channels are reordered to BGRA by Pillow, so the raw bytes of the
+#  * image are the little-endian ARGB integers and are read straight into the
+#  * array without visiting pixels in Python. Pixels are in row-major order;
+#  * pixels with alpha below 255 are left out.
+#  *
+#  * @param image A PIL image in any mode.
+#  * @return An array('I') of colors in ARGB format.
+#  */
+def get_argb_pixels(image):
+    rgba = image.convert("RGBA")
+    red, green, blue, alpha = rgba.split()
+    bgra = Image.merge("RGBA", (blue, green, red, alpha))
+    pixels = array(ARGB_TYPECODE)
+    pixels.frombytes(bgra.tobytes())
+    if sys.byteorder != "little":
+        pixels.byteswap()
+    if alpha.getextrema()[0] < 255:
+        opaque = alpha.point(OPAQUE_LUT).tobytes()
+        pixels = array(ARGB_TYPECODE, compress(pixels, opaque))
     return pixels
 
 
-def source_color_from_image(image):
+# /**
+#  * Counts the opaque colors of an image, converting band_height rows at a
+#  * time, so only one band of pixels is held besides the image itself.
+#  *
+#  * @param image A PIL image in any mode.
+#  * @param band_height Number of rows converted at a time.
+#  * @return Counter with keys of colors in ARGB format, in the order they
+#  *     first appear, and values of the number of pixels of that color. This
+#  *     is the same as QuantizerMap.quantize(get_argb_pixels(image)).
+#  */
+def get_argb_histogram(image, band_height=DEFAULT_BAND_HEIGHT):
+    count_by_color = Counter()
+    for top in range(0, image.height, band_height):
+        bottom = min(top + band_height, image.height)
+        count_by_color.update(
+            get_argb_pixels(image.crop((0, top, image.width, bottom)))
+        )
+    return count_by_color
+
+
+# /**
+#  * @param image A PIL image, a path or a binary file object.
+#  * @param max_pixels The image is downsampled to at most this many pixels
+#  *     before quantizing; None quantizes every pixel.
+#  * @param resample Pillow resampling filter used to downsample.
+#  */
+def source_color_from_image(
+    image, max_pixels=DEFAULT_MAX_PIXELS, resample=DEFAULT_RESAMPLE
+):
     # profiler = Profiler()
     # profiler.start()
 
-    pixels = get_argb_pixels(image)
+    count_by_color = extract_downsampled(
+        image, get_argb_histogram, max_pixels, resample
+    )
 
     # // Convert Pixels to Material Colors
-    result = QuantizerCelebi.quantize(pixels, 128)
+    result = QuantizerCelebi.quantize_histogram(count_by_color, 128)
     ranked = Score.score(result)
     top = ranked[0]
 
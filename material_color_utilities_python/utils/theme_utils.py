@@ -12,7 +12,11 @@ from material_color_utilities_python.blend.blend import Blend
 from material_color_utilities_python.palettes.core_palette import CorePalette
 from material_color_utilities_python.scheme.scheme import Scheme
 from material_color_utilities_python.types.theme_type import Theme
-from material_color_utilities_python.utils.image_utils import source_color_from_image
+from material_color_utilities_python.utils.image_utils import (
+    DEFAULT_MAX_PIXELS,
+    DEFAULT_RESAMPLE,
+    source_color_from_image,
+)
 
 
 def custom_color(source, color):
@@ -72,12 +76,19 @@ def theme_from_source_color(source, custom_colors=[]) -> Theme:
 # /**
 #  * Generate a theme from an image source
 #  *
-#  * @param image Image element
+#  * @param image PIL image, path or binary file object
 #  * @param custom_colors Array of custom colors
+#  * @param max_pixels Pixel budget the image is downsampled to, or None
+#  * @param resample Pillow resampling filter used to downsample
 #  * @return Theme object
 #  */
-def theme_from_image(image, custom_colors=[]):
-    source = source_color_from_image(image)
+def theme_from_image(
+    image,
+    custom_colors=[],
+    max_pixels=DEFAULT_MAX_PIXELS,
+    resample=DEFAULT_RESAMPLE,
+):
+    source = source_color_from_image(image, max_pixels, resample)
     return theme_from_source_color(source, custom_colors)
 
 
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import PIL.Image
+
+from material_color_utilities_python import (
+    configure_executor,
+    shutdown_executor,
+    source_color_from_image,
+    source_color_from_image_async,
+    theme_from_image,
+    theme_from_image_async,
+    theme_from_source_color,
+    theme_from_source_color_async,
+)
+
+
+def test_async_functions_match_sync_and_respect_concurrency():
+    running = 0
+    peak = 0
+    guard = threading.Lock()
+
+    def track(function):
+        def wrapper(*args):
+            nonlocal running, peak
+            with guard:
+                running += 1
+                peak = max(peak, running)
+            try:
+                return function(*args)
+            finally:
+                with guard:
+                    running -= 1
+
+        return wrapper
+
+    class TrackingExecutor(ThreadPoolExecutor):
+        def submit(self, function, *args, **kwargs):
+            return super().submit(track(function), *args, **kwargs)
+
+    image = PIL.Image.new("RGB", (300, 200), (66, 133, 244))
+
+    async def main():
+        themes = await asyncio.gather(
+            *[theme_from_source_color_async(0xFF4285F4) for _ in range(4)]
+        )
+        color = await source_color_from_image_async(image)
+        return themes, color
+
+    with TrackingExecutor(max_workers=4) as executor:
+        configure_executor(executor, concurrency=2)
+        try:
+            themes, color = asyncio.run(main())
+        finally:
+            shutdown_executor()
+    expected = theme_from_source_color(0xFF4285F4)
+    assert all(theme == expected for theme in themes)
+    assert color == source_color_from_image(image)
+    assert peak <= 2
+
+
+def test_async_functions_accept_file_objects(tmp_path):
+    image = PIL.Image.new("RGB", (300, 200), (66, 133, 244))
+    path = tmp_path / "image.png"
+    image.save(path)
+
+    async def main(color_file, theme_file):
+        color = await source_color_from_image_async(color_file)
+        theme = await theme_from_image_async(theme_file)
+        return color, theme
+
+    # Open files can't be pickled, so this checks they never reach the worker
+    # process.
+    configure_executor(max_workers=1)
+    try:
+        with open(path, "rb") as color_file, open(path, "rb") as theme_file:
+            color, theme = asyncio.run(main(color_file, theme_file))
+    finally:
+        shutdown_executor()
+    with open(path, "rb") as file:
+        assert color == source_color_from_image(file)
+    assert theme == theme_from_image(image)
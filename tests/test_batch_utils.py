@@ -0,0 +1,19 @@
+import PIL.Image
+
+from material_color_utilities_python import (
+    source_color_from_image,
+    source_colors_from_images,
+)
+
+
+def test_source_colors_from_images_reports_errors_per_item(assets_folder):
+    path = assets_folder / "image.jpg"
+    image = PIL.Image.new("RGB", (300, 200), (66, 133, 244))
+    items = [path, assets_folder / "missing.jpg", image]
+    results = list(source_colors_from_images(items, workers=1, chunk_size=2))
+    assert [result.index for result in results] == [0, 1, 2]
+    assert results[0].value == source_color_from_image(path)
+    assert isinstance(results[1].error, FileNotFoundError)
+    assert results[2].value == source_color_from_image(image)
+    unordered = source_colors_from_images(items, workers=1, ordered=False)
+    assert sorted(result.index for result in unordered) == [0, 1, 2]
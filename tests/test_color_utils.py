@@ -0,0 +1,41 @@
+import random
+
+from material_color_utilities_python.utils.color_utils import (
+    argb_from_linrgb,
+    argb_from_linrgb_fast,
+    argb_from_xyz,
+    argb_from_xyz_fast,
+    delinearized,
+    delinearized_fast,
+    lab_f,
+    lstar_from_argb,
+    xyz_from_argb,
+)
+
+
+def test_delinearized_fast_matches_delinearized():
+    rng = random.Random(3)
+    for _ in range(10000):
+        value = rng.uniform(0.0, 100.0)
+        assert delinearized_fast(value) == delinearized(value)
+    assert delinearized_fast(0.0) == 0
+    assert delinearized_fast(100.0) == 255
+
+
+def test_fast_conversions_match_exact_conversions():
+    rng = random.Random(5)
+    for _ in range(1000):
+        argb = 0xFF000000 | rng.getrandbits(24)
+        xyz = xyz_from_argb(argb)
+        assert argb_from_xyz(*xyz) == argb
+        assert argb_from_xyz_fast(*xyz) == argb
+        linrgb = [rng.uniform(0.0, 100.0) for _ in range(3)]
+        assert argb_from_linrgb_fast(linrgb) == argb_from_linrgb(linrgb)
+
+
+def test_lstar_from_argb_matches_xyz():
+    rng = random.Random(4)
+    for _ in range(1000):
+        argb = 0xFF000000 | rng.getrandbits(24)
+        expected = 116.0 * lab_f(xyz_from_argb(argb)[1] / 100.0) - 16.0
+        assert abs(lstar_from_argb(argb) - expected) < 1e-9
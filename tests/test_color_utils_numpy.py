@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from material_color_utilities_python.utils import color_utils
+
+np = pytest.importorskip("numpy")
+color_utils_numpy = pytest.importorskip(
+    "material_color_utilities_python.utils.color_utils_numpy"
+)
+
+
+def random_colors(seed, count=2000):
+    rng = random.Random(seed)
+    return [0xFF000000 | rng.getrandbits(24) for _ in range(count)]
+
+
+def test_argb_to_lab_xyz_and_lstar_match_scalar():
+    colors = random_colors(1)
+    argb = np.array(colors, dtype=np.uint32)
+    lab = color_utils_numpy.lab_from_argb(argb)
+    xyz = color_utils_numpy.xyz_from_argb(argb)
+    lstar = color_utils_numpy.lstar_from_argb(argb)
+    for i, color in enumerate(colors):
+        assert lab[:, i] == pytest.approx(color_utils.lab_from_argb(color), abs=1e-9)
+        assert xyz[:, i] == pytest.approx(color_utils.xyz_from_argb(color), abs=1e-9)
+        assert lstar[i] == pytest.approx(color_utils.lstar_from_argb(color), abs=1e-9)
+    assert np.array_equal(color_utils_numpy.red_from_argb(argb), argb >> 16 & 255)
+
+
+def test_lab_xyz_and_lstar_to_argb_match_scalar():
+    colors = random_colors(2)
+    lab = [color_utils.lab_from_argb(color) for color in colors]
+    lightness, a, b = np.array(lab).T
+    assert color_utils_numpy.argb_from_lab(lightness, a, b).tolist() == [
+        color_utils.argb_from_lab(*values) for values in lab
+    ]
+    x, y, z = color_utils_numpy.xyz_from_argb(colors)
+    assert color_utils_numpy.argb_from_xyz(x, y, z).tolist() == colors
+    lstar = np.linspace(0.0, 100.0, 1001)
+    assert color_utils_numpy.argb_from_lstar(lstar).tolist() == [
+        color_utils.argb_from_lstar(value) for value in lstar.tolist()
+    ]
@@ -0,0 +1,162 @@
+import random
+
+import pytest
+
+from material_color_utilities_python.hct import hct
+from material_color_utilities_python.hct.cam16 import Cam16
+from material_color_utilities_python.hct.hct import (
+    SOLVER_ANALYTIC,
+    SOLVER_SEARCH,
+    Hct,
+    get_int,
+)
+from material_color_utilities_python.hct.hct_cache import HctCache
+from material_color_utilities_python.hct.hct_solver import HctSolver
+from material_color_utilities_python.hct.max_chroma_table import (
+    compute_max_chroma,
+    max_chroma,
+    max_chroma_bound,
+)
+from material_color_utilities_python.hct.viewing_conditions import ViewingConditions
+from material_color_utilities_python.utils.color_utils import lstar_from_argb
+
+
+def test_solver_round_trips_srgb_colors():
+    rng = random.Random(42)
+    for _ in range(500):
+        argb = 0xFF000000 | rng.getrandbits(24)
+        hct = Hct.from_int(argb)
+        assert get_int(hct.hue, hct.chroma, hct.tone, SOLVER_ANALYTIC) == argb
+
+
+def test_solver_agrees_with_search():
+    rng = random.Random(7)
+    for _ in range(50):
+        hue = rng.uniform(0.0, 360.0)
+        chroma = rng.uniform(0.0, 120.0)
+        tone = rng.uniform(1.0, 99.0)
+        searched = get_int(hue, chroma, tone, SOLVER_SEARCH)
+        solved = get_int(hue, chroma, tone, SOLVER_ANALYTIC)
+        assert abs(lstar_from_argb(searched) - lstar_from_argb(solved)) < 0.5
+        assert (
+            abs(Cam16.from_int(searched).chroma - Cam16.from_int(solved).chroma) < 4.0
+        )
+
+
+def test_search_solver_is_unchanged():
+    # Results of the original search solver, which stays the reference.
+    expected = {
+        (25, 84, 70): 0xFFFF897A,
+        (25, 84, 40): 0xFFBA1B1B,
+        (282, 48, 80): 0xFFBCC2FF,
+        (145, 120, 60): 0xFF00A822,
+        (0, 200, 50): 0xFFE7007A,
+    }
+    for (hue, chroma, tone), argb in expected.items():
+        assert get_int(hue, chroma, tone, SOLVER_SEARCH) == argb
+
+
+def test_max_chroma_bound_is_never_reached():
+    rng = random.Random(11)
+    for _ in range(200):
+        hue = rng.uniform(0.0, 360.0)
+        tone = rng.uniform(0.0, 100.0)
+        reached = compute_max_chroma(hue, tone)
+        assert reached <= max_chroma_bound(hue, tone)
+        assert abs(max_chroma(hue, tone) - reached) < 10.0
+
+
+def test_max_chroma_shortcut_matches_solver():
+    rng = random.Random(5)
+    for _ in range(500):
+        hue = rng.uniform(0.0, 360.0)
+        chroma = rng.uniform(40.0, 150.0)
+        tone = rng.uniform(0.0, 100.0)
+        assert get_int(hue, chroma, tone) == HctSolver.solve_to_int(hue, chroma, tone)
+
+
+def test_cache_counts_hits_misses_and_evictions():
+    cache = hct.enable_cache(max_entries=2, quantization=0.5)
+    try:
+        first = get_int(25.0, 84.0, 40.0)
+        assert get_int(25.1, 84.0, 40.0) == first
+        get_int(25.0, 84.0, 80.0)
+        get_int(25.0, 84.0, 90.0)
+        stats = hct.cache_stats()
+        assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 3, 1, 2)
+        assert list(cache.entries) == [
+            (25.0, 84.0, 80.0, hct.default_viewing_conditions, SOLVER_ANALYTIC),
+            (25.0, 84.0, 90.0, hct.default_viewing_conditions, SOLVER_ANALYTIC),
+        ]
+    finally:
+        hct.disable_cache()
+    assert hct.cache_stats() is None
+
+
+def test_cache_never_confuses_viewing_conditions():
+    cache = HctCache()
+    solved = []
+
+    def solve(hue, chroma, tone, viewing_conditions, solver):
+        solved.append(viewing_conditions.n)
+        return len(solved)
+
+    for _ in range(5):
+        # A new object each time, possibly at the address of the last one.
+        viewing_conditions = ViewingConditions.make()
+        cache.get_int(25.0, 84.0, 40.0, viewing_conditions, SOLVER_ANALYTIC, solve)
+        del viewing_conditions
+    assert len(solved) == 5
+
+
+def test_hct_solves_lazily():
+    hct_color = Hct.from_hct(120.0, 200.0, 50.0)
+    assert hct_color.argb is None
+    hct_color.hue = 240.0
+    assert hct_color.argb is None
+    assert hct_color.to_int() == get_int(240.0, 200.0, 50.0)
+    assert hct_color.chroma < 200.0
+    assert Hct.from_int(0xFF4285F4).argb == 0xFF4285F4
+
+
+def test_chained_setters_solve_the_final_request():
+    steps = [("hue", 240.0), ("chroma", 60.0), ("tone", 90.0)]
+    for start in [(120.0, 200.0, 50.0), (27.0, 40.0, 10.0), (300.0, 80.0, 95.0)]:
+        # Solving after every set, as the setters did before they were lazy.
+        step_by_step = Hct.from_hct(*start)
+        for name, value in steps:
+            components = {
+                "hue": step_by_step.hue,
+                "chroma": step_by_step.chroma,
+                "tone": step_by_step.tone,
+            }
+            components[name] = value
+            step_by_step = Hct.from_hct(
+                components["hue"], components["chroma"], components["tone"]
+            )
+        chained = Hct.from_hct(*start)
+        read_between = Hct.from_hct(*start)
+        read_between.resolve()
+        for name, value in steps:
+            setattr(chained, name, value)
+            setattr(read_between, name, value)
+            read_between.resolve()
+        assert chained.to_int() == get_int(240.0, 60.0, 90.0)
+        assert read_between.to_int() == step_by_step.to_int()
+    # Starting dark, hue 240 clips chroma before the tone is raised, so the
+    # two differ.
+    chained = Hct.from_hct(27.0, 40.0, 10.0)
+    chained.hue = 240.0
+    chained.chroma = 60.0
+    chained.tone = 90.0
+    assert chained.to_int() == 0xFFC8E6FF
+    assert step_by_step.to_int() != chained.to_int()
+
+
+def test_cam16_reduced_and_lazy_dimensions():
+    cam = Cam16.from_int(0xFF4285F4)
+    assert Cam16.hue_chroma_j_from_int(0xFF4285F4) == (cam.hue, cam.chroma, cam.j)
+    same = Cam16.from_ucs(cam.j_star, cam.a_star, cam.b_star)
+    assert same.hue == pytest.approx(cam.hue)
+    assert same.chroma == pytest.approx(cam.chroma)
+    assert cam.distance(same) < 1e-3
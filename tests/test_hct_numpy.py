@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+from material_color_utilities_python.hct.hct import Hct
+from material_color_utilities_python.hct.hct_solver import HctSolver
+
+np = pytest.importorskip("numpy")
+hct_numpy = pytest.importorskip("material_color_utilities_python.hct.hct_numpy")
+
+
+def test_hct_from_argb_matches_scalar():
+    rng = random.Random(1)
+    argbs = [0xFF000000 | rng.getrandbits(24) for _ in range(300)]
+    hue, chroma, tone = hct_numpy.hct_from_argb(np.array(argbs, dtype=np.uint32))
+    for i, argb in enumerate(argbs):
+        hct = Hct.from_int(argb)
+        assert hct.chroma == pytest.approx(chroma[i], abs=1e-9)
+        assert hct.tone == pytest.approx(tone[i], abs=1e-9)
+        if hct.chroma > 1.0:
+            assert hct.hue == pytest.approx(hue[i], abs=1e-9)
+
+
+def test_argb_from_hct_matches_solver():
+    rng = np.random.default_rng(2)
+    hue = rng.uniform(0.0, 360.0, 2000)
+    chroma = rng.uniform(0.0, 150.0, 2000)
+    tone = rng.uniform(0.0, 100.0, 2000)
+    argbs = hct_numpy.argb_from_hct(hue, chroma, tone)
+    assert argbs.dtype == np.uint32
+    for i in range(len(argbs)):
+        assert argbs[i] == HctSolver.solve_to_int(hue[i], chroma[i], tone[i])
@@ -0,0 +1,73 @@
+import pytest
+
+from material_color_utilities_python.hct import cam16, hct_table
+from material_color_utilities_python.hct.cam16 import Cam16
+from material_color_utilities_python.hct.hct import Hct
+from material_color_utilities_python.utils import color_utils
+
+np = pytest.importorskip("numpy")
+
+# Values are rounded to 1 / SCALE.
+TOLERANCE = 0.5 / hct_table.SCALE + 1e-9
+
+
+@pytest.fixture
+def small_table(tmp_path, monkeypatch):
+    # Only the first 4096 colors, so the table builds quickly.
+    monkeypatch.setattr(hct_table, "COLOR_COUNT", 1 << 12)
+    path = tmp_path / "hct.bin"
+    hct_table.build_hct_table(path, chunk_size=1000)
+    yield path
+    hct_table.disable_hct_table()
+
+
+def test_table_round_trip(small_table):
+    table = hct_table.HctTable(small_table)
+    try:
+        for rgb in range(0, 1 << 12, 7):
+            argb = 0xFF000000 | rgb
+            cam = Cam16.from_int(argb)
+            hue, chroma, j = table.hue_chroma_j(argb)
+            assert 0.0 <= hue < 360.0
+            hue_difference = abs(hue - cam.hue)
+            assert min(hue_difference, 360.0 - hue_difference) <= TOLERANCE
+            assert chroma == pytest.approx(cam.chroma, abs=TOLERANCE)
+            assert j == pytest.approx(cam.j, abs=TOLERANCE)
+            assert table.lstar(argb) == pytest.approx(
+                color_utils.lstar_from_argb(argb), abs=TOLERANCE
+            )
+    finally:
+        table.close()
+
+
+def test_hues_below_360_wrap_to_zero():
+    # These colors have hues within 0.005 of 360.
+    argb = np.array([0xFF13090C, 0xFF1B010A, 0xFF33121E], dtype=np.uint32)
+    assert hct_table.table_records(argb)[:, 0].tolist() == [0, 0, 0]
+
+
+def test_invalid_tables_are_rejected(small_table, tmp_path):
+    data = small_table.read_bytes()
+    wrong_magic = tmp_path / "magic.bin"
+    wrong_magic.write_bytes(b"NOTATABL" + data[8:])
+    truncated = tmp_path / "truncated.bin"
+    truncated.write_bytes(data[:-2])
+    for path in (wrong_magic, truncated):
+        with pytest.raises(ValueError):
+            hct_table.HctTable(path)
+
+
+def test_enable_and_disable_install_lookups(small_table):
+    argb = 0xFF000ABC
+    expected = Hct.from_int(argb)
+    table = hct_table.enable_hct_table(small_table)
+    assert cam16.hue_chroma_j_lookup == table.hue_chroma_j
+    assert color_utils.lstar_lookup == table.lstar
+    looked_up = Hct.from_int(argb)
+    assert looked_up.hue == pytest.approx(expected.hue, abs=TOLERANCE)
+    assert looked_up.chroma == pytest.approx(expected.chroma, abs=TOLERANCE)
+    assert looked_up.tone == pytest.approx(expected.tone, abs=TOLERANCE)
+    hct_table.disable_hct_table()
+    assert cam16.hue_chroma_j_lookup is None
+    assert color_utils.lstar_lookup is None
+    assert hct_table.active_table is None
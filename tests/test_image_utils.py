@@ -0,0 +1,58 @@
+import io
+from array import array
+
+import PIL.Image
+
+from material_color_utilities_python.quantize.quantizer_celebi import QuantizerCelebi
+from material_color_utilities_python.quantize.quantizer_map import QuantizerMap
+from material_color_utilities_python.utils.image_utils import (
+    downsample_image,
+    get_argb_histogram,
+    get_argb_pixels,
+    get_downsampled_argb_pixels,
+    open_image,
+)
+
+
+def test_get_argb_pixels_packs_opaque_pixels_in_order():
+    image = PIL.Image.new("RGBA", (2, 2))
+    image.putdata([(1, 2, 3, 255), (4, 5, 6, 0), (7, 8, 9, 128), (250, 128, 0, 255)])
+    pixels = get_argb_pixels(image)
+    assert isinstance(pixels, array)
+    assert list(pixels) == [0xFF010203, 0xFFFA8000]
+    assert list(get_argb_pixels(image.convert("RGB"))) == [
+        0xFF010203,
+        0xFF040506,
+        0xFF070809,
+        0xFFFA8000,
+    ]
+
+
+def test_downsample_image_keeps_aspect_ratio_within_budget():
+    image = PIL.Image.new("RGB", (1200, 900), (66, 133, 244))
+    small = downsample_image(image, max_pixels=112 * 112)
+    assert small.size == (129, 96)
+    assert small.width * small.height <= 112 * 112
+    assert downsample_image(small, max_pixels=112 * 112) is small
+    assert downsample_image(image, max_pixels=None) is image
+
+
+def test_jpeg_files_are_decoded_at_reduced_scale():
+    buffer = io.BytesIO()
+    PIL.Image.new("RGB", (1600, 1200), (66, 133, 244)).save(buffer, "JPEG")
+    buffer.seek(0)
+    with open_image(buffer, max_pixels=112 * 112) as image:
+        assert image.size == (200, 150)
+    buffer.seek(0)
+    pixels = get_downsampled_argb_pixels(buffer, max_pixels=112 * 112)
+    assert len(pixels) == 129 * 96
+
+
+def test_banded_histogram_matches_pixel_quantization(assets_folder):
+    image = downsample_image(PIL.Image.open(assets_folder / "image.jpg"))
+    pixels = get_argb_pixels(image)
+    histogram = get_argb_histogram(image, band_height=7)
+    assert list(histogram.items()) == list(QuantizerMap.quantize(pixels).items())
+    assert QuantizerCelebi.quantize_histogram(
+        histogram, 128
+    ) == QuantizerCelebi.quantize(pixels, 128)
@@ -0,0 +1,212 @@
+import random
+
+import pytest
+
+from material_color_utilities_python.quantize.quantizer_celebi import QuantizerCelebi
+from material_color_utilities_python.quantize.quantizer_map import QuantizerMap
+from material_color_utilities_python.quantize.quantizer_wsmeans import QuantizerWsMeans
+from material_color_utilities_python.quantize.quantizer_wu import (
+    Box,
+    CreateBoxesResult,
+    QuantizerWu,
+)
+
+
+def test_celebi_entry_points_agree():
+    rng = random.Random(8)
+    palette = [0xFF000000 | rng.getrandbits(24) for _ in range(200)]
+    pixels = [rng.choice(palette) for _ in range(5000)]
+    count_by_color = QuantizerMap.quantize(pixels)
+    expected = QuantizerCelebi.quantize(pixels, 16)
+    assert QuantizerCelebi.quantize_histogram(count_by_color, 16) == expected
+    assert (
+        QuantizerCelebi.quantize_counts(
+            list(count_by_color.keys()), list(count_by_color.values()), 16
+        )
+        == expected
+    )
+    assert sum(expected.values()) == len(pixels)
+
+
+def test_wu_numpy_matches_wu():
+    pytest.importorskip("numpy")
+    from material_color_utilities_python.quantize.quantizer_wu_numpy import (
+        QuantizerWuNumpy,
+    )
+
+    rng = random.Random(9)
+    colors = list({0xFF000000 | rng.getrandbits(24) for _ in range(3000)})
+    counts = [rng.randint(1, 10 ** rng.randint(0, 9)) for _ in colors]
+    for index_bits in (4, 6):
+        assert QuantizerWuNumpy(index_bits=index_bits).quantize_counts(
+            colors, counts, 32
+        ) == QuantizerWu(index_bits=index_bits).quantize_counts(colors, counts, 32)
+    wu = QuantizerWu()
+    wu_numpy = QuantizerWuNumpy()
+    for max_colors in (1, 16, 128):
+        assert wu_numpy.quantize_counts(
+            colors, counts, max_colors
+        ) == wu.quantize_counts(colors, counts, max_colors)
+    for name in ("weights", "moments_r", "moments_g", "moments_b"):
+        assert getattr(wu_numpy, name).tolist() == list(getattr(wu, name))
+    # Beyond 2^53 the float squared moments round differently.
+    assert wu_numpy.moments.tolist() == pytest.approx(list(wu.moments), rel=1e-12)
+
+
+class ReferenceQuantizerWu(QuantizerWu):
+    # The box selection loop of the reference implementation, scanning every
+    # box for the largest variance.
+    def create_boxes(self, max_colors):
+        self.cubes = [Box() for _ in range(max_colors)]
+        volume_variance = [0.0] * max_colors
+        self.cubes[0].r1 = self.side_length - 1
+        self.cubes[0].g1 = self.side_length - 1
+        self.cubes[0].b1 = self.side_length - 1
+        generated_color_count = max_colors
+        next_index = 0
+        i = 1
+        while i < max_colors:
+            if self.cut(self.cubes[next_index], self.cubes[i]):
+                for index in (next_index, i):
+                    cube = self.cubes[index]
+                    volume_variance[index] = (
+                        self.variance(cube) if cube.vol > 1 else 0.0
+                    )
+            else:
+                volume_variance[next_index] = 0.0
+                i -= 1
+            next_index = 0
+            temp = volume_variance[0]
+            for j in range(1, i + 1):
+                if volume_variance[j] > temp:
+                    temp = volume_variance[j]
+                    next_index = j
+            if temp <= 0.0:
+                generated_color_count = i + 1
+                break
+            i += 1
+        return CreateBoxesResult(max_colors, generated_color_count)
+
+
+def test_wu_boxes_match_reference():
+    def boxes(quantizer):
+        return [
+            (cube.r0, cube.r1, cube.g0, cube.g1, cube.b0, cube.b1)
+            for cube in quantizer.cubes
+        ]
+
+    rng = random.Random(14)
+    for size, bits, max_colors in ((2000, 24, 32), (40, 24, 64), (300, 6, 128)):
+        pixels = [
+            0xFF000000 | rng.getrandbits(bits) << (24 - bits) for _ in range(size)
+        ]
+        quantizer = QuantizerWu()
+        reference = ReferenceQuantizerWu()
+        assert quantizer.quantize(pixels, max_colors) == reference.quantize(
+            pixels, max_colors
+        )
+        assert boxes(quantizer) == boxes(reference)
+
+    pixels = [0xFFFF0000] * 5 + [0xFF00FF00] * 3 + [0xFF0000FF] * 2
+    pixels += [0xFF202020, 0xFFE0E0E0, 0xFF808000]
+    assert QuantizerWu().quantize(pixels, 4) == [
+        0xFF20B906,
+        0xFFFF0000,
+        0xFF0000FF,
+        0xFFE0E0E0,
+    ]
+
+
+def test_wu_index_bits_must_fit_a_channel():
+    with pytest.raises(ValueError):
+        QuantizerWu(index_bits=9)
+    assert len(QuantizerWu(index_bits=4).quantize([0xFF102030] * 3, 4)) == 1
+
+
+def test_wsmeans_numpy_matches_wsmeans():
+    pytest.importorskip("numpy")
+    from material_color_utilities_python.quantize.quantizer_wsmeans_numpy import (
+        QuantizerWsMeansNumpy,
+    )
+
+    rng = random.Random(10)
+    pixels = [0xFF000000 | rng.getrandbits(24) for _ in range(2000)]
+    pixels += [0xFF000000 | rng.getrandbits(6) for _ in range(2000)]
+    # Repeated starting clusters make points equally close to several.
+    for starting_clusters in ([], pixels[:40], pixels[:8] * 2):
+        for max_colors in (1, 16):
+            expected = QuantizerWsMeans.quantize(pixels, starting_clusters, max_colors)
+            result = QuantizerWsMeansNumpy.quantize(
+                pixels, starting_clusters, max_colors
+            )
+            assert list(result.items()) == list(expected.items())
+
+
+def test_wsmeans_iteration_options():
+    rng = random.Random(11)
+    pixels = [0xFF000000 | rng.getrandbits(24) for _ in range(1000)]
+    quantizers = [QuantizerWsMeans]
+    try:
+        from material_color_utilities_python.quantize.quantizer_wsmeans_numpy import (
+            QuantizerWsMeansNumpy,
+        )
+
+        quantizers.append(QuantizerWsMeansNumpy)
+    except ImportError:
+        pass
+    reports = []
+    for quantizer in quantizers:
+        stats = []
+        quantizer.quantize(pixels, [], 16, max_iterations=3, on_iteration=stats.append)
+        assert [s.iteration for s in stats] == [0, 1, 2]
+        assert all(s.elapsed >= 0 and s.cost > 0 for s in stats)
+        reports.append(stats)
+        with pytest.raises(ValueError):
+            quantizer.quantize(pixels, [], 16, max_iterations=0)
+    for stats in reports[1:]:
+        for s, expected in zip(stats, reports[0]):
+            assert s.points_moved == expected.points_moved
+            assert s.cost == pytest.approx(expected.cost)
+            assert s.centroid_shift == pytest.approx(expected.centroid_shift)
+    # Without a movement threshold, more points move in the first iteration.
+    loose = []
+    QuantizerWsMeans.quantize(
+        pixels,
+        [],
+        16,
+        max_iterations=1,
+        min_movement_distance=0.0,
+        on_iteration=loose.append,
+    )
+    assert loose[0].points_moved >= reports[0][0].points_moved
+
+
+def test_wsmeans_minibatch():
+    from material_color_utilities_python.quantize.quantizer_wsmeans_minibatch import (
+        QuantizerWsMeansMiniBatch,
+    )
+
+    rng = random.Random(13)
+    pixels = [0xFF000000 | rng.getrandbits(24) for _ in range(3000)]
+    pixels += [0xFF000000 | rng.getrandbits(4) << 20 for _ in range(3000)]
+    starting_clusters = pixels[:16]
+    # Few enough colors for the whole input to fit in a batch.
+    assert QuantizerWsMeansMiniBatch.quantize(
+        pixels, starting_clusters, 16, batch_size=len(pixels)
+    ) == QuantizerWsMeans.quantize(pixels, starting_clusters, 16)
+
+    stats = []
+    result = QuantizerWsMeansMiniBatch.quantize(
+        pixels, starting_clusters, 16, batch_size=256, on_iteration=stats.append
+    )
+    assert result == QuantizerWsMeansMiniBatch.quantize(
+        pixels, starting_clusters, 16, batch_size=256
+    )
+    assert 0 < len(result) <= 16
+    assert sum(result.values()) == pytest.approx(len(pixels), abs=16)
+    assert len(stats) == 10
+    assert QuantizerCelebi.quantize(pixels, 16, batch_size=256) == (
+        QuantizerWsMeansMiniBatch.quantize(
+            pixels, QuantizerWu().quantize(pixels, 16), 16, batch_size=256
+        )
+    )
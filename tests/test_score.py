@@ -0,0 +1,19 @@
+from material_color_utilities_python.hct.cam16 import Cam16
+from material_color_utilities_python.score.score import HueChroma, Score
+
+COLORS = [0xFF4285F4, 0xFFFF0000, 0xFF808080, 0xFF00FF00, 0xFF101010]
+
+
+def test_filter_accepts_cam16_and_hue_chroma_maps():
+    proportions = {color: 0.5 for color in COLORS}
+    proportions[0xFF00FF00] = 0.0
+    cams = {color: Cam16.from_int(color) for color in COLORS}
+    hue_chromas = {color: HueChroma(cam.hue, cam.chroma) for color, cam in cams.items()}
+    expected = [0xFF4285F4, 0xFFFF0000]
+    assert Score.filter(proportions, cams) == expected
+    assert Score.filter(proportions, hue_chromas) == expected
+
+
+def test_score_ranks_by_chroma_and_proportion():
+    population = {0xFF4285F4: 100, 0xFFFF0000: 50, 0xFF808080: 300}
+    assert Score.score(population) == [0xFFFF0000, 0xFF4285F4]